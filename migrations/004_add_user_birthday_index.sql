@@ -0,0 +1,13 @@
+-- Migration: Doğum günü sorgusu için ifade (expression) index'i
+-- Date: 2026-10-14
+-- Description: get_users_with_birthday_today sorgusu strftime('%m-%d', birthday) yerine
+--              substr(birthday, 6, 5) ile filtreleme yapar. Bu index sayesinde günlük
+--              doğum günü kontrolü tam tablo taraması yapmaz.
+
+-- NOT: Bu index DatabaseClient._create_indexes() tarafından açılışta
+-- otomatik olarak oluşturulur. Manuel uygulama için:
+CREATE INDEX IF NOT EXISTS idx_users_birthday_md ON users(substr(birthday, 6, 5));
+
+-- slack_id kolonu UNIQUE olduğu için SQLite otomatik index oluşturur;
+-- idx_users_slack_id zaten _create_indexes() içinde tanımlıdır.
+CREATE INDEX IF NOT EXISTS idx_users_slack_id ON users(slack_id);
@@ -0,0 +1,10 @@
+-- Migration: Açık yardım istekleri için bileşik index
+-- Date: 2026-10-14
+-- Description: HelpRepository.get_open_requests / iter_open_requests sorguları
+--              status = 'open' filtresi ve created_at DESC sıralaması kullanır.
+--              (status, created_at) index'i sayesinde sorgu tam tablo taraması ve
+--              ayrı bir sıralama adımı yerine sınırlı bir index aralığı okur.
+
+-- NOT: Bu index DatabaseClient._create_indexes() tarafından açılışta
+-- otomatik olarak oluşturulur. Manuel uygulama için:
+CREATE INDEX IF NOT EXISTS idx_help_requests_status_created ON help_requests(status, created_at DESC);
@@ -5,6 +5,7 @@ Ana bot dosyası: Tüm servislerin entegrasyonu ve slash komutları
 """
 
 import os
+import ssl
 import asyncio
 from dotenv import load_dotenv
 from slack_bolt import App
@@ -90,7 +91,19 @@ settings = get_settings()
 if not settings.slack_bot_token:
     raise ValueError("SLACK_BOT_TOKEN environment variable is required!")
 
-app = App(token=settings.slack_bot_token)
+# Tüm Slack WebClient'ları tek bir SSL context'i paylaşır; böylece CA sertifikaları
+# her HTTPS bağlantısında yeniden yüklenmez ve TLS kurulum maliyeti azalır.
+slack_ssl_context = ssl.create_default_context()
+
+
+def create_slack_client(token: str) -> WebClient:
+    """Ortak SSL context ile yapılandırılmış bir Slack WebClient oluşturur."""
+    return WebClient(token=token, ssl=slack_ssl_context, timeout=30)
+
+
+# Bot client bir kez oluşturulur ve tüm Command Manager'lar tarafından paylaşılır
+bot_client = create_slack_client(settings.slack_bot_token)
+app = App(client=bot_client)
 
 # ============================================================================
 # CLIENT İLKLENDİRME (Singleton Pattern)
@@ -113,7 +126,7 @@ logger.info("[i] Command Manager'lar ilklendiriliyor...")
 # User token varsa kanal oluşturma ve erişim için kullan
 user_client = None
 if settings.slack_user_token:
-    user_client = WebClient(token=settings.slack_user_token)
+    user_client = create_slack_client(settings.slack_user_token)
     logger.info("[i] User token bulundu - kanal oluşturma ve erişim işlemleri için kullanılacak")
 else:
     logger.warning("[!] User token bulunamadı - workspace kısıtlamaları kanal oluşturmayı engelleyebilir")
@@ -163,7 +176,8 @@ knowledge_service = KnowledgeService(
     vector_client, groq_client
 )
 help_service = HelpService(
-    chat_manager, conv_manager, user_manager, help_repo, user_repo, groq_client, cron_client
+    chat_manager, conv_manager, user_manager, help_repo, user_repo, groq_client, cron_client,
+    workspace_owner_id=settings.slack_workspace_owner_id
 )
 statistics_service = StatisticsService(
     user_repo, match_repo, help_repo, feedback_repo, poll_repo, vote_repo
@@ -222,6 +236,9 @@ try:
 except Exception as e:
     logger.warning(f"[!] Challenge kanalları periyodik kontrolü başlatılamadı: {e}")
 
+# Süresi dolan yardım kanallarını kapat (her 1 dakikada bir)
+help_service.schedule_close_sweep()
+
 # Değerlendirmeleri periyodik olarak kontrol et (her 1 saatte bir)
 def check_pending_evaluations():
     """Deadline'ı geçmiş değerlendirmeleri finalize et."""
@@ -37,6 +37,8 @@ class DatabaseClient(metaclass=SingletonMeta):
         try:
             conn = sqlite3.connect(self.db_path)
             conn.row_factory = sqlite3.Row  # Dict benzeri erişim için
+            # WAL modunda NORMAL senkronizasyon güvenlidir ve her commit'teki fsync maliyetini azaltır
+            conn.execute("PRAGMA synchronous = NORMAL")
             # FOREIGN KEY desteğini etkinleştir (her connection için zorunlu)
             conn.execute("PRAGMA foreign_keys = ON")
             # Foreign key'lerin açık olduğunu doğrula
@@ -54,6 +56,8 @@ class DatabaseClient(metaclass=SingletonMeta):
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
+                # WAL modu: okuyucular yazıcıyı (ve yazıcı okuyucuları) bloklamaz; veritabanı dosyasında kalıcıdır
+                cursor.execute("PRAGMA journal_mode = WAL")
                 # Foreign key'leri aç (tüm tablolar için)
                 cursor.execute("PRAGMA foreign_keys = ON")
                 
@@ -1379,6 +1383,8 @@ class DatabaseClient(metaclass=SingletonMeta):
                 ("idx_help_requests_status", "help_requests", "status"),
                 ("idx_help_requests_requester", "help_requests", "requester_id"),
                 ("idx_help_requests_helper", "help_requests", "helper_id"),
+                # Açık istekleri en yeniden eskiye listeleyen sorgu için bileşik index (sıralama index'ten okunur)
+                ("idx_help_requests_status_created", "help_requests", "status, created_at DESC"),
                 
                 # Match indexes
                 ("idx_matches_status", "matches", "status"),
@@ -1393,6 +1399,9 @@ class DatabaseClient(metaclass=SingletonMeta):
                 
                 # User indexes
                 ("idx_users_slack_id", "users", "slack_id"),
+                # Doğum günü sorgusu için ifade (expression) index'i: birthday YYYY-MM-DD formatında,
+                # substr(birthday, 6, 5) MM-DD kısmını verir (strftime deterministik olmadığı için index'lenemez)
+                ("idx_users_birthday_md", "users", "substr(birthday, 6, 5)"),
             ]
             
             for index_name, table_name, column_name in indexes:
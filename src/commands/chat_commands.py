@@ -1,6 +1,11 @@
-from typing import List, Optional, Dict, Any, Union
+import time
+import asyncio
+import threading
+from typing import List, Optional, Dict, Any, Union, Tuple
+from slack_sdk.errors import SlackApiError
 from src.core.logger import logger
 from src.core.exceptions import SlackClientError
+from src.core.rate_limiter import retry_after_seconds
 
 class ChatManager:
     """
@@ -8,9 +13,51 @@ class ChatManager:
     Dökümantasyon: https://api.slack.com/methods?filter=chat
     """
 
+    # Kanal başına mesaj hızı (Slack: ~1 mesaj/saniye/kanal, kısa patlamalara izin verilir)
+    POST_RATE_PER_SECOND = 1.0
+    POST_BURST = 3
+    POST_MAX_RETRIES = 3
+
     def __init__(self, client, user_client=None):
         self.client = client  # Bot token client
         self.user_client = user_client  # User token client (opsiyonel, user token ile oluşturulan kanallar için)
+        # Kanal başına token bucket: {kanal: (token, son_güncelleme)}; token eksiye düşerse istek sıraya girer
+        self._post_buckets: Dict[str, Tuple[float, float]] = {}
+        self._post_lock = threading.Lock()
+
+    def _reserve_post_slot(self, channel: str) -> float:
+        """
+        Kanal için bir gönderim hakkı ayırır ve gönderimden önce beklenecek süreyi (saniye) döndürür.
+        Lock thread seviyesindedir; farklı event loop'lardan (handler, cron) gelen çağrılar aynı sırayı paylaşır.
+        """
+        with self._post_lock:
+            now = time.monotonic()
+            tokens, updated_at = self._post_buckets.get(channel, (float(self.POST_BURST), now))
+            tokens = min(float(self.POST_BURST), tokens + (now - updated_at) * self.POST_RATE_PER_SECOND) - 1
+            self._post_buckets[channel] = (tokens, now)
+            return 0.0 if tokens >= 0 else -tokens / self.POST_RATE_PER_SECOND
+
+    async def enqueue_post(self, channel: str, text: str, blocks: Optional[List[Dict[str, Any]]] = None, **kwargs) -> Dict[str, Any]:
+        """
+        Mesajı kanal bazlı hız sınırına uyarak gönderir (chat.postMessage).
+        Kanalın kotası doluysa sırası gelene kadar beklenir; rate limit (ratelimited)
+        hatasında Slack'in önerdiği Retry-After süresi kadar beklenip tekrar denenir.
+        """
+        delay = self._reserve_post_slot(channel)
+        if delay:
+            logger.debug(f"[i] Mesaj sıraya alındı (Kanal: {channel}) - {delay:.2f} saniye bekleniyor")
+            await asyncio.sleep(delay)
+
+        for attempt in range(self.POST_MAX_RETRIES):
+            try:
+                # Senkron HTTP çağrısı thread'de çalışır; event loop diğer işleri beklemeden sürdürür
+                return await asyncio.to_thread(self.post_message, channel=channel, text=text, blocks=blocks, **kwargs)
+            except SlackClientError as e:
+                if e.extra.get("error") != "ratelimited" or attempt == self.POST_MAX_RETRIES - 1:
+                    raise
+                retry_after = retry_after_seconds(getattr(e.__cause__, "response", None))
+                logger.warning(f"[!] chat.postMessage rate limit! {retry_after} saniye bekleniyor... (Kanal: {channel})")
+                await asyncio.sleep(retry_after)
 
     def post_message(self, channel: str, text: str, blocks: Optional[List[Dict[str, Any]]] = None, **kwargs) -> Dict[str, Any]:
         """
@@ -30,6 +77,10 @@ class ChatManager:
                 return response
             else:
                 raise SlackClientError(f"Mesaj gönderilemedi: {response['error']}")
+        except SlackApiError as e:
+            # Hata kodu extra'da taşınır; enqueue_post rate limitte Retry-After için orijinal yanıta __cause__ ile ulaşır
+            logger.error(f"[X] chat.postMessage hatası: {e}")
+            raise SlackClientError(str(e), extra={"error": e.response.get("error")}) from e
         except Exception as e:
             logger.error(f"[X] chat.postMessage hatası: {e}")
             raise SlackClientError(str(e))
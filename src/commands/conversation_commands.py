@@ -1,4 +1,5 @@
 from typing import List, Optional, Dict, Any, Union
+from slack_sdk.errors import SlackApiError
 from src.core.logger import logger
 from src.core.exceptions import SlackClientError
 
@@ -192,9 +193,20 @@ class ConversationManager:
                     except Exception:
                         return {"id": channel_id}
             
-            raise SlackClientError(response.get('error', 'Bilinmeyen hata'))
+            raise SlackClientError(response.get('error', 'Bilinmeyen hata'), extra={"error": response.get('error')})
         except SlackClientError:
             raise
+        except SlackApiError as e:
+            # Hata kodu çağıranların metin aramadan kontrol edebilmesi için extra'da taşınır
+            code = e.response.get("error")
+            if code in ("cant_invite_self", "already_in_channel"):
+                logger.warning(f"[!] Bazı kullanıcılar zaten kanalda, devam ediliyor: {code}")
+                try:
+                    return self.get_info(channel_id)
+                except Exception:
+                    return {"id": channel_id}
+            logger.error(f"[X] conversations.invite hatası: {e}")
+            raise SlackClientError(str(e), extra={"error": code}) from e
         except Exception as e:
             error_str = str(e)
             # 'cant_invite_self' veya 'already_in_channel' hatalarını yumuşak handle et
@@ -385,7 +397,13 @@ class ConversationManager:
             response = self.client.conversations_history(channel=channel_id, limit=limit, **kwargs)
             if response["ok"]:
                 return response.get("messages", [])
-            raise SlackClientError(response['error'])
+            raise SlackClientError(response['error'], extra={"error": response['error']})
+        except SlackClientError:
+            raise
+        except SlackApiError as e:
+            # Hata kodu çağıranların metin aramadan kontrol edebilmesi için extra'da taşınır
+            logger.error(f"[X] conversations.history hatası: {e}")
+            raise SlackClientError(str(e), extra={"error": e.response.get("error")}) from e
         except Exception as e:
             logger.error(f"[X] conversations.history hatası: {e}")
             raise SlackClientError(str(e))
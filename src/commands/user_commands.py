@@ -1,6 +1,10 @@
-from typing import List, Optional, Dict, Any
+import time
+import asyncio
+from typing import List, Optional, Dict, Any, Iterator
+from slack_sdk.errors import SlackApiError
 from src.core.logger import logger
 from src.core.exceptions import SlackClientError
+from src.core.rate_limiter import retry_after_seconds
 
 class UserManager:
     """
@@ -17,31 +21,104 @@ class UserManager:
         """
         try:
             response = self.client.users_info(user=user_id)
-            if response["ok"]:
-                user = response["user"]
-                logger.info(f"[i] Kullanıcı bilgisi alındı: {user.get('real_name')} ({user_id})")
-                return user
-            else:
-                raise SlackClientError(f"Kullanıcı bilgisi alınamadı: {response['error']}")
+            user = response["user"]
+            logger.info("[i] Kullanıcı bilgisi alındı: %s (%s)", user.get('real_name'), user_id)
+            return user
+        except SlackApiError as e:
+            logger.error("[X] users.info hatası: %s", e, exc_info=True)
+            raise SlackClientError(f"Kullanıcı bilgisi alınamadı: {e.response['error']}") from e
         except Exception as e:
-            logger.error(f"[X] users.info hatası: {e}", exc_info=True)
-            raise SlackClientError(str(e))
+            # Bağlantı/zaman aşımı gibi SDK dışı hatalar da çağıranlara SlackClientError olarak iletilir
+            logger.error("[X] users.info hatası: %s", e, exc_info=True)
+            raise SlackClientError(str(e)) from e
 
-    def list_users(self, limit: int = 100, cursor: Optional[str] = None) -> Dict[str, Any]:
+    async def batch_get_user_info(self, user_ids: List[str], max_concurrency: int = 8) -> Dict[str, Dict[str, Any]]:
         """
-        Workspace'teki tüm kullanıcıları listeler (users.list).
+        Birden fazla kullanıcının bilgisini paralel olarak getirir (users.info).
+        Senkron client çağrıları thread'lerde çalıştırılır; Semaphore ile aynı anda en fazla
+        max_concurrency istek yapılır (Slack Tier 4 limiti). Rate limit'te Retry-After kadar beklenir.
+        Dönüş: {user_id: user}; bilgisi alınamayan kullanıcılar sonuçta yer almaz.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(user_id: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    response = await asyncio.to_thread(self._call_with_retry, "users.info", self.client.users_info, user=user_id)
+                    return response["user"]
+                except SlackApiError as e:
+                    logger.warning("[!] users.info alınamadı: %s | Hata: %s", user_id, e.response.get("error"))
+                    return None
+                except Exception as e:
+                    logger.warning("[!] users.info alınamadı: %s | Hata: %s", user_id, e)
+                    return None
+
+        unique_ids = list(dict.fromkeys(user_ids))
+        users = await asyncio.gather(*(fetch(user_id) for user_id in unique_ids))
+        logger.info("[i] Toplu kullanıcı bilgisi alındı: %s/%s kişi", sum(1 for u in users if u), len(unique_ids))
+        return {user_id: user for user_id, user in zip(unique_ids, users) if user}
+
+    def _call_with_retry(self, method_name: str, api_call, max_retries: int = 3, **kwargs) -> Dict[str, Any]:
+        """
+        Slack API çağrısını yapar. Rate limit (ratelimited) hatasında Slack'in
+        önerdiği Retry-After süresi kadar bekleyip aynı isteği tekrar dener.
+        """
+        for attempt in range(max_retries):
+            try:
+                return api_call(**kwargs)
+            except SlackApiError as e:
+                if e.response.get("error") != "ratelimited" or attempt == max_retries - 1:
+                    raise
+                retry_after = retry_after_seconds(e.response)
+                logger.warning("[!] %s rate limit! %s saniye bekleniyor... (deneme %s/%s)", method_name, retry_after, attempt + 1, max_retries)
+                time.sleep(retry_after)
+
+    def _users_list(self, limit: int, cursor: Optional[str] = None, max_retries: int = 3) -> Dict[str, Any]:
+        """users.list çağrısını rate limit tekrar denemesiyle yapar."""
+        return self._call_with_retry("users.list", self.client.users_list, max_retries=max_retries, limit=limit, cursor=cursor)
+
+    def list_users(self, limit: int = 200, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Workspace'teki kullanıcıların tek bir sayfasını listeler (users.list).
+        Slack'in rate limit'ine takılmamak için her zaman limit gönderilir.
         """
         try:
-            response = self.client.users_list(limit=limit, cursor=cursor)
-            if response["ok"]:
-                members = response.get("members", [])
-                logger.info(f"[i] Kullanıcı listesi alındı: {len(members)} kişi")
-                return response
-            else:
-                raise SlackClientError(f"Kullanıcılar listelenemedi: {response['error']}")
+            response = self._users_list(limit=limit, cursor=cursor)
+            members = response.get("members", [])
+            logger.info("[i] Kullanıcı listesi alındı: %s kişi", len(members))
+            return response
+        except SlackApiError as e:
+            logger.error("[X] users.list hatası: %s", e, exc_info=True)
+            raise SlackClientError(f"Kullanıcılar listelenemedi: {e.response['error']}") from e
         except Exception as e:
-            logger.error(f"[X] users.list hatası: {e}", exc_info=True)
-            raise SlackClientError(str(e))
+            logger.error("[X] users.list hatası: %s", e, exc_info=True)
+            raise SlackClientError(str(e)) from e
+
+    def list_users_page(self, limit: int = 200, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        users.list için tek sayfalık sonucu sadeleştirilmiş olarak döndürür.
+        Dönüş: {"users": [...], "has_more": bool, "next_cursor": str | None}
+        """
+        response = self.list_users(limit=limit, cursor=cursor)
+        next_cursor = response.get("response_metadata", {}).get("next_cursor") or None
+        return {
+            "users": response.get("members", []),
+            "has_more": next_cursor is not None,
+            "next_cursor": next_cursor
+        }
+
+    def iter_all_users(self, page_size: int = 200) -> Iterator[Dict[str, Any]]:
+        """
+        Workspace'teki tüm kullanıcıları cursor ile sayfa sayfa gezerek tek tek döndürür (generator).
+        Tüm liste belleğe alınmaz; çağıran taraf istediği anda döngüden çıkabilir.
+        """
+        cursor = None
+        while True:
+            page = self.list_users_page(limit=page_size, cursor=cursor)
+            yield from page["users"]
+            if not page["has_more"]:
+                break
+            cursor = page["next_cursor"]
 
     def lookup_by_email(self, email: str) -> Dict[str, Any]:
         """
@@ -49,15 +126,15 @@ class UserManager:
         """
         try:
             response = self.client.users_lookupByEmail(email=email)
-            if response["ok"]:
-                user = response["user"]
-                logger.info(f"[+] Email ile kullanıcı bulundu: {email} -> {user['id']}")
-                return user
-            else:
-                raise SlackClientError(f"Email ile kullanıcı bulunamadı: {response['error']}")
+            user = response["user"]
+            logger.info("[+] Email ile kullanıcı bulundu: %s -> %s", email, user['id'])
+            return user
+        except SlackApiError as e:
+            logger.error("[X] users.lookupByEmail hatası: %s", e)
+            raise SlackClientError(f"Email ile kullanıcı bulunamadı: {e.response['error']}") from e
         except Exception as e:
-            logger.error(f"[X] users.lookupByEmail hatası: {e}")
-            raise SlackClientError(str(e))
+            logger.error("[X] users.lookupByEmail hatası: %s", e)
+            raise SlackClientError(str(e)) from e
 
     def get_presence(self, user_id: str) -> str:
         """
@@ -65,15 +142,15 @@ class UserManager:
         """
         try:
             response = self.client.users_getPresence(user=user_id)
-            if response["ok"]:
-                presence = response.get("presence", "unknown")
-                logger.info(f"[i] Kullanıcı durumu ({user_id}): {presence}")
-                return presence
-            else:
-                raise SlackClientError(f"Durum bilgisi alınamadı: {response['error']}")
+            presence = response.get("presence", "unknown")
+            logger.info("[i] Kullanıcı durumu (%s): %s", user_id, presence)
+            return presence
+        except SlackApiError as e:
+            logger.error("[X] users.getPresence hatası: %s", e)
+            raise SlackClientError(f"Durum bilgisi alınamadı: {e.response['error']}") from e
         except Exception as e:
-            logger.error(f"[X] users.getPresence hatası: {e}")
-            raise SlackClientError(str(e))
+            logger.error("[X] users.getPresence hatası: %s", e)
+            raise SlackClientError(str(e)) from e
 
     def set_presence(self, presence: str) -> bool:
         """
@@ -81,15 +158,15 @@ class UserManager:
         presence: 'auto' veya 'away'
         """
         try:
-            response = self.client.users_setPresence(presence=presence)
-            if response["ok"]:
-                logger.info(f"[+] Durum manuel ayarlandı: {presence}")
-                return True
-            else:
-                raise SlackClientError(f"Durum ayarlanamadı: {response['error']}")
+            self.client.users_setPresence(presence=presence)
+            logger.info("[+] Durum manuel ayarlandı: %s", presence)
+            return True
+        except SlackApiError as e:
+            logger.error("[X] users.setPresence hatası: %s", e)
+            raise SlackClientError(f"Durum ayarlanamadı: {e.response['error']}") from e
         except Exception as e:
-            logger.error(f"[X] users.setPresence hatası: {e}")
-            raise SlackClientError(str(e))
+            logger.error("[X] users.setPresence hatası: %s", e)
+            raise SlackClientError(str(e)) from e
 
     def get_profile(self, user_id: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -97,15 +174,15 @@ class UserManager:
         """
         try:
             response = self.client.users_profile_get(user=user_id)
-            if response["ok"]:
-                profile = response.get("profile", {})
-                logger.info(f"[i] Profil bilgisi alındı: {user_id or 'SELF'}")
-                return profile
-            else:
-                raise SlackClientError(f"Profil alınamadı: {response['error']}")
+            profile = response.get("profile", {})
+            logger.info("[i] Profil bilgisi alındı: %s", user_id or 'SELF')
+            return profile
+        except SlackApiError as e:
+            logger.error("[X] users.profile.get hatası: %s", e)
+            raise SlackClientError(f"Profil alınamadı: {e.response['error']}") from e
         except Exception as e:
-            logger.error(f"[X] users.profile.get hatası: {e}")
-            raise SlackClientError(str(e))
+            logger.error("[X] users.profile.get hatası: %s", e)
+            raise SlackClientError(str(e)) from e
 
     def set_profile(self, profile_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -113,14 +190,14 @@ class UserManager:
         """
         try:
             response = self.client.users_profile_set(profile=profile_data)
-            if response["ok"]:
-                logger.info("[+] Profil başarıyla güncellendi")
-                return response.get("profile", {})
-            else:
-                raise SlackClientError(f"Profil güncellenemedi: {response['error']}")
+            logger.info("[+] Profil başarıyla güncellendi")
+            return response.get("profile", {})
+        except SlackApiError as e:
+            logger.error("[X] users.profile.set hatası: %s", e)
+            raise SlackClientError(f"Profil güncellenemedi: {e.response['error']}") from e
         except Exception as e:
-            logger.error(f"[X] users.profile.set hatası: {e}")
-            raise SlackClientError(str(e))
+            logger.error("[X] users.profile.set hatası: %s", e)
+            raise SlackClientError(str(e)) from e
 
     def get_identity(self) -> Dict[str, Any]:
         """
@@ -128,15 +205,15 @@ class UserManager:
         """
         try:
             response = self.client.users_identity()
-            if response["ok"]:
-                identity = response.get("user", {})
-                logger.info(f"[i] Kimlik bilgisi onaylandı: {identity.get('name')}")
-                return identity
-            else:
-                raise SlackClientError(f"Kimlik doğrulanamadı: {response['error']}")
+            identity = response.get("user", {})
+            logger.info("[i] Kimlik bilgisi onaylandı: %s", identity.get('name'))
+            return identity
+        except SlackApiError as e:
+            logger.error("[X] users.identity hatası: %s", e)
+            raise SlackClientError(f"Kimlik doğrulanamadı: {e.response['error']}") from e
         except Exception as e:
-            logger.error(f"[X] users.identity hatası: {e}")
-            raise SlackClientError(str(e))
+            logger.error("[X] users.identity hatası: %s", e)
+            raise SlackClientError(str(e)) from e
 
     def list_conversations(self, user_id: Optional[str] = None, types: str = "public_channel,private_channel") -> List[Dict[str, Any]]:
         """
@@ -144,46 +221,50 @@ class UserManager:
         """
         try:
             response = self.client.users_conversations(user=user_id, types=types)
-            if response["ok"]:
-                channels = response.get("channels", [])
-                logger.info(f"[i] Kullanıcı konuşmaları listelendi: {len(channels)} adet")
-                return channels
-            else:
-                raise SlackClientError(f"Konuşmalar alınamadı: {response['error']}")
+            channels = response.get("channels", [])
+            logger.info("[i] Kullanıcı konuşmaları listelendi: %s adet", len(channels))
+            return channels
+        except SlackApiError as e:
+            logger.error("[X] users.conversations hatası: %s", e)
+            raise SlackClientError(f"Konuşmalar alınamadı: {e.response['error']}") from e
         except Exception as e:
-            logger.error(f"[X] users.conversations hatası: {e}")
-            raise SlackClientError(str(e))
+            logger.error("[X] users.conversations hatası: %s", e)
+            raise SlackClientError(str(e)) from e
 
     def set_photo(self, image_path: str) -> bool:
         """
         Kullanıcı profil fotoğrafını ayarlar (users.setPhoto).
+        Dosya yolu doğrudan SDK'ya verilir; dosyayı SDK açar ve istek bitince kapatır.
         """
         try:
-            with open(image_path, "rb") as image_file:
-                response = self.client.users_setPhoto(image=image_file)
-            if response["ok"]:
-                logger.info(f"[+] Profil fotoğrafı güncellendi: {image_path}")
-                return True
-            else:
-                raise SlackClientError(f"Fotoğraf ayarlanamadı: {response['error']}")
+            self.client.users_setPhoto(image=image_path)
+            logger.info("[+] Profil fotoğrafı güncellendi: %s", image_path)
+            return True
+        except SlackApiError as e:
+            logger.error("[X] users.setPhoto hatası: %s", e)
+            raise SlackClientError(f"Fotoğraf ayarlanamadı: {e.response['error']}") from e
+        except OSError as e:
+            # Dosya okuma veya bağlantı hatası (URLError da OSError alt sınıfıdır)
+            logger.error("[X] Fotoğraf yüklenemedi: %s | Hata: %s", image_path, e)
+            raise SlackClientError(f"Fotoğraf yüklenemedi: {e}") from e
         except Exception as e:
-            logger.error(f"[X] users.setPhoto hatası: {e}")
-            raise SlackClientError(str(e))
+            logger.error("[X] users.setPhoto hatası: %s", e)
+            raise SlackClientError(str(e)) from e
 
     def delete_photo(self) -> bool:
         """
         Kullanıcı profil fotoğrafını siler (users.deletePhoto).
         """
         try:
-            response = self.client.users_deletePhoto()
-            if response["ok"]:
-                logger.info("[+] Profil fotoğrafı silindi")
-                return True
-            else:
-                raise SlackClientError(f"Fotoğraf silinemedi: {response['error']}")
+            self.client.users_deletePhoto()
+            logger.info("[+] Profil fotoğrafı silindi")
+            return True
+        except SlackApiError as e:
+            logger.error("[X] users.deletePhoto hatası: %s", e)
+            raise SlackClientError(f"Fotoğraf silinemedi: {e.response['error']}") from e
         except Exception as e:
-            logger.error(f"[X] users.deletePhoto hatası: {e}")
-            raise SlackClientError(str(e))
+            logger.error("[X] users.deletePhoto hatası: %s", e)
+            raise SlackClientError(str(e)) from e
 
     def lookup_discoverable_contact(self, email: str) -> Dict[str, Any]:
         """
@@ -191,14 +272,14 @@ class UserManager:
         """
         try:
             response = self.client.users_discoverableContacts_lookup(email=email)
-            if response["ok"]:
-                logger.info(f"[i] Keşfedilebilir kişi sorgusu başarılı: {email}")
-                return response
-            else:
-                raise SlackClientError(f"Kişi sorgulanamadı: {response['error']}")
+            logger.info("[i] Keşfedilebilir kişi sorgusu başarılı: %s", email)
+            return response
+        except SlackApiError as e:
+            logger.error("[X] users.discoverableContacts.lookup hatası: %s", e)
+            raise SlackClientError(f"Kişi sorgulanamadı: {e.response['error']}") from e
         except Exception as e:
-            logger.error(f"[X] users.discoverableContacts.lookup hatası: {e}")
-            raise SlackClientError(str(e))
+            logger.error("[X] users.discoverableContacts.lookup hatası: %s", e)
+            raise SlackClientError(str(e)) from e
 
     def set_active(self) -> bool:
         """
@@ -206,12 +287,12 @@ class UserManager:
         Not: Bu metod bazı uygulama tiplerinde kısıtlanmış olabilir.
         """
         try:
-            response = self.client.users_setActive()
-            if response["ok"]:
-                logger.info("[+] Kullanıcı aktif olarak işaretlendi")
-                return True
-            else:
-                raise SlackClientError(f"Aktif işareti başarısız: {response['error']}")
+            self.client.users_setActive()
+            logger.info("[+] Kullanıcı aktif olarak işaretlendi")
+            return True
+        except SlackApiError as e:
+            logger.error("[X] users.setActive hatası: %s", e)
+            raise SlackClientError(f"Aktif işareti başarısız: {e.response['error']}") from e
         except Exception as e:
-            logger.error(f"[X] users.setActive hatası: {e}")
-            raise SlackClientError(str(e))
+            logger.error("[X] users.setActive hatası: %s", e)
+            raise SlackClientError(str(e)) from e
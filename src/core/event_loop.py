@@ -0,0 +1,53 @@
+"""
+Slack handler'ları için kalıcı (persistent) asyncio event loop yönetimi.
+"""
+
+import asyncio
+import threading
+import concurrent.futures
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine, Optional
+from src.core.logger import logger
+
+
+# Global event loop instance
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+# asyncio.to_thread ile çalıştırılan bloklayıcı Slack çağrıları için thread sayısı
+EXECUTOR_MAX_WORKERS = 32
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Ayrı bir daemon thread'de sürekli çalışan event loop'u döndürür.
+    Her komutta yeni loop kurup kapatmak yerine (asyncio.run) tek loop yeniden kullanılır;
+    böylece loop içinde oluşturulan bağlantı havuzları komutlar arasında korunur.
+    """
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                loop.set_default_executor(
+                    ThreadPoolExecutor(max_workers=EXECUTOR_MAX_WORKERS, thread_name_prefix="cemil-io")
+                )
+                thread = threading.Thread(target=loop.run_forever, name="cemil-event-loop", daemon=True)
+                thread.start()
+                _loop = loop
+                logger.info("[i] Kalıcı event loop başlatıldı.")
+    return _loop
+
+
+def run_async(coro: Coroutine, timeout: Optional[float] = None) -> Any:
+    """
+    Coroutine'i kalıcı event loop'a gönderir ve sonucunu bekler.
+    Zaman aşımında coroutine iptal edilir (paylaşılan loop'ta çalışmayı sürdürmez) ve yerleşik TimeoutError fırlatılır.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+    try:
+        return future.result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        # Python 3.10'da concurrent.futures.TimeoutError yerleşik TimeoutError'ın alt sınıfı değildir
+        future.cancel()
+        raise TimeoutError(f"Coroutine {timeout} saniyede tamamlanamadı") from None
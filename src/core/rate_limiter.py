@@ -22,6 +22,13 @@ class RateLimiter:
         self.max_requests = max_requests
         self.window_seconds = window_seconds
         self.requests: Dict[str, list] = defaultdict(list)
+        # Limiti aşan kullanıcıların engelinin kalkacağı zaman; engelliyken pencere hesabı yapılmaz
+        self.blocked_until: Dict[str, datetime] = {}
+    
+    @staticmethod
+    def _limit_message(wait_seconds: int) -> str:
+        """Limit aşımı hata mesajını oluşturur."""
+        return f"⏳ Çok fazla istek! Lütfen {wait_seconds} saniye sonra tekrar deneyin."
     
     def is_allowed(self, user_id: str) -> tuple[bool, Optional[str]]:
         """
@@ -31,6 +38,16 @@ class RateLimiter:
             (izin_var_mı, hata_mesajı veya None)
         """
         now = datetime.now()
+        
+        # Hızlı yol: engelli kullanıcı için tek dict okuması yeterli
+        until = self.blocked_until.get(user_id)
+        if until is not None:
+            if until > now:
+                return False, self._limit_message(int((until - now).total_seconds()))
+            # Bolt dinleyicileri birden fazla thread'de çalışır; aynı süresi dolmuş engeli
+            # gören iki istek olabileceğinden del yerine pop kullanılır (KeyError oluşmaz)
+            self.blocked_until.pop(user_id, None)
+        
         user_requests = self.requests[user_id]
         
         # Eski istekleri temizle (zaman penceresi dışındakiler)
@@ -41,8 +58,9 @@ class RateLimiter:
         # Rate limit kontrolü
         if len(user_requests) >= self.max_requests:
             oldest_request = min(user_requests) if user_requests else now
-            wait_seconds = int((oldest_request + timedelta(seconds=self.window_seconds) - now).total_seconds())
-            return False, f"⏳ Çok fazla istek! Lütfen {wait_seconds} saniye sonra tekrar deneyin."
+            until = oldest_request + timedelta(seconds=self.window_seconds)
+            self.blocked_until[user_id] = until
+            return False, self._limit_message(int((until - now).total_seconds()))
         
         # İsteği kaydet
         user_requests.append(now)
@@ -52,6 +70,7 @@ class RateLimiter:
         """Kullanıcının rate limit kayıtlarını sıfırla."""
         if user_id in self.requests:
             del self.requests[user_id]
+        self.blocked_until.pop(user_id, None)
     
     def cleanup_old_entries(self):
         """Eski kayıtları temizle (memory leak önleme)."""
@@ -67,10 +86,29 @@ class RateLimiter:
         for user_id in users_to_remove:
             del self.requests[user_id]
         
+        # Süresi dolmuş engelleri temizle
+        for user_id in [uid for uid, until in list(self.blocked_until.items()) if until <= now]:
+            self.blocked_until.pop(user_id, None)
+        
         if users_to_remove:
             logger.debug(f"[i] Rate limiter temizlendi: {len(users_to_remove)} kullanıcı kaldırıldı")
 
 
+def retry_after_seconds(response, default: int = 1) -> int:
+    """
+    Slack rate limit yanıtındaki Retry-After süresini (saniye) döndürür.
+    HTTP header adları büyük/küçük harfe duyarsızdır; 'retry-after' gibi yazımlar da okunur.
+    """
+    headers = getattr(response, "headers", None) or {}
+    for name, value in headers.items():
+        if name.lower() == "retry-after":
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                return default
+    return default
+
+
 # Global rate limiter instance
 _global_rate_limiter: Optional[RateLimiter] = None
 
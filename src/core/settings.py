@@ -40,6 +40,10 @@ class BotSettings(BaseSettings):
     
     # Admin Ayarları
     admin_slack_id: Optional[str] = Field(None, description="Admin kullanıcı Slack ID")
+    slack_workspace_owner_id: Optional[str] = Field(
+        None,
+        description="Yardım kanallarına davet edilecek workspace owner Slack ID (boşsa users.list ile aranır)"
+    )
     
     # Logging Ayarları
     log_level: str = Field("INFO", description="Log seviyesi (DEBUG, INFO, WARNING, ERROR)")
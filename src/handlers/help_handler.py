@@ -2,16 +2,36 @@
 Topluluk yardımlaşma komut handler'ları.
 """
 
-import asyncio
+from types import MappingProxyType
 from slack_bolt import App
 from src.core.logger import logger
 from src.core.settings import get_settings
+from src.core.event_loop import run_async
 from src.core.rate_limiter import get_rate_limiter
 from src.core.validators import HelpRequest
 from src.commands import ChatManager
 from src.services import HelpService
 from src.repositories import UserRepository
 
+# Handler'ın async işlemi beklediği maksimum süre (saniye)
+ASYNC_TIMEOUT_SECONDS = 30
+
+# Detaylar görünümündeki durum metinleri (salt okunur, her tıklamada yeniden oluşturulmaz)
+_STATUS_TEXTS = MappingProxyType({
+    "open": "🟢 Açık",
+    "in_progress": "🟡 Devam ediyor",
+    "resolved": "✅ Çözüldü",
+    "closed": "🔴 Kapatıldı"
+})
+
+
+def _display_name(user_repo: UserRepository, user_id: str) -> str:
+    """Log satırları için kullanıcı adını döndürür; bulunamazsa Slack ID kullanılır."""
+    try:
+        return user_repo.get_display_name(user_id) or user_id
+    except Exception:
+        return user_id
+
 
 def setup_help_handlers(
     app: App,
@@ -25,6 +45,8 @@ def setup_help_handlers(
         max_requests=settings.rate_limit_requests,
         window_seconds=settings.rate_limit_window
     )
+    # Bound method bir kez alınır; her istekte attribute zinciri çözülmez
+    is_allowed = rate_limiter.is_allowed
     
     @app.command("/yardim-iste")
     def handle_help_request(ack, body):
@@ -35,19 +57,13 @@ def setup_help_handlers(
         text = body.get("text", "").strip()
         
         # Rate limiting kontrolü
-        allowed, error_msg = rate_limiter.is_allowed(user_id)
+        allowed, error_msg = is_allowed(user_id)
         if not allowed:
             chat_manager.post_ephemeral(channel=channel_id, user=user_id, text=error_msg)
             return
         
-        # Kullanıcı bilgisini al
-        try:
-            user_data = user_repo.get_by_slack_id(user_id)
-            user_name = user_data.get('full_name', user_id) if user_data else user_id
-        except Exception:
-            user_name = user_id
-        
-        logger.info(f"[>] /yardim-iste komutu geldi | Kullanıcı: {user_name} ({user_id}) | Kanal: {channel_id}")
+        # İsim sorgusu ack yolunda yapılmaz; giriş logunda sadece Slack ID yazılır
+        logger.info("[>] /yardim-iste komutu geldi | Kullanıcı: %s | Kanal: %s", user_id, channel_id)
         
         # Input validation
         if not text:
@@ -68,7 +84,7 @@ def setup_help_handlers(
             )
             return
         
-        # Async işlemi sync wrapper ile çalıştır
+        # Async işlemi kalıcı event loop üzerinde çalıştır
         async def process_help_request():
             try:
                 help_id = await help_service.create_help_request(
@@ -84,17 +100,28 @@ def setup_help_handlers(
                     text="✅ Yardım isteğiniz paylaşıldı! Topluluk üyeleri size yardım edebilir."
                 )
                 
-                logger.info(f"[+] Yardım isteği oluşturuldu | Kullanıcı: {user_name} ({user_id}) | ID: {help_id}")
+                logger.info("[+] Yardım isteği oluşturuldu | Kullanıcı: %s (%s) | ID: %s", _display_name(user_repo, user_id), user_id, help_id)
                 
             except Exception as e:
-                logger.error(f"[X] Yardım isteği hatası: {e}", exc_info=True)
+                logger.error("[X] Yardım isteği hatası: %s", e, exc_info=True)
                 chat_manager.post_ephemeral(
                     channel=channel_id,
                     user=user_id,
                     text="Yardım isteği oluşturulurken bir hata oluştu. Lütfen tekrar deneyin."
                 )
         
-        asyncio.run(process_help_request())
+        try:
+            run_async(process_help_request(), timeout=ASYNC_TIMEOUT_SECONDS)
+        except TimeoutError:
+            logger.warning("[!] Yardım isteği %s saniyede tamamlanamadı, iptal edildi | Kullanıcı: %s", ASYNC_TIMEOUT_SECONDS, user_id)
+            try:
+                chat_manager.post_ephemeral(
+                    channel=channel_id,
+                    user=user_id,
+                    text="⏳ Yardım isteği zaman aşımına uğradı. Lütfen tekrar deneyin."
+                )
+            except Exception as e:
+                logger.warning("[!] Zaman aşımı bildirimi gönderilemedi: %s", e)
     
     @app.action("help_join_channel")
     def handle_help_join_channel(ack, body):
@@ -104,16 +131,10 @@ def setup_help_handlers(
         channel_id = body["channel"]["id"]
         help_id = body["actions"][0]["value"]
         
-        # Kullanıcı bilgisini al
-        try:
-            user_data = user_repo.get_by_slack_id(user_id)
-            user_name = user_data.get('full_name', user_id) if user_data else user_id
-        except Exception:
-            user_name = user_id
-        
-        logger.info(f"[>] Kanala katılma isteği | Kullanıcı: {user_name} ({user_id}) | Yardım ID: {help_id}")
+        # İsim sorgusu ack yolunda yapılmaz; giriş logunda sadece Slack ID yazılır
+        logger.info("[>] Kanala katılma isteği | Kullanıcı: %s | Yardım ID: %s", user_id, help_id)
         
-        # Async işlemi sync wrapper ile çalıştır
+        # Async işlemi kalıcı event loop üzerinde çalıştır
         async def process_join_channel():
             try:
                 result = await help_service.join_help_channel(help_id, user_id)
@@ -125,24 +146,35 @@ def setup_help_handlers(
                         user=user_id,
                         text=result["message"]
                     )
-                    logger.info(f"[+] Kanala katılma başarılı | Kullanıcı: {user_name} ({user_id}) | Yardım ID: {help_id}")
+                    logger.info("[+] Kanala katılma başarılı | Kullanıcı: %s (%s) | Yardım ID: %s", _display_name(user_repo, user_id), user_id, help_id)
                 else:
                     chat_manager.post_ephemeral(
                         channel=channel_id,
                         user=user_id,
                         text=result["message"]
                     )
-                    logger.warning(f"[!] Kanala katılma başarısız | Kullanıcı: {user_name} ({user_id}) | Sebep: {result.get('message')}")
+                    logger.warning("[!] Kanala katılma başarısız | Kullanıcı: %s | Sebep: %s", user_id, result.get('message'))
                     
             except Exception as e:
-                logger.error(f"[X] Kanala katılma hatası: {e}", exc_info=True)
+                logger.error("[X] Kanala katılma hatası: %s", e, exc_info=True)
                 chat_manager.post_ephemeral(
                     channel=channel_id,
                     user=user_id,
                     text="Kanala katılırken bir hata oluştu. Lütfen tekrar deneyin."
                 )
         
-        asyncio.run(process_join_channel())
+        try:
+            run_async(process_join_channel(), timeout=ASYNC_TIMEOUT_SECONDS)
+        except TimeoutError:
+            logger.warning("[!] Kanala katılma %s saniyede tamamlanamadı, iptal edildi | Kullanıcı: %s", ASYNC_TIMEOUT_SECONDS, user_id)
+            try:
+                chat_manager.post_ephemeral(
+                    channel=channel_id,
+                    user=user_id,
+                    text="⏳ Kanala katılma zaman aşımına uğradı. Lütfen tekrar deneyin."
+                )
+            except Exception as e:
+                logger.warning("[!] Zaman aşımı bildirimi gönderilemedi: %s", e)
     
     @app.action("help_details")
     def handle_help_details(ack, body):
@@ -162,12 +194,7 @@ def setup_help_handlers(
             return
         
         # Durum metni
-        status_text = {
-            "open": "🟢 Açık",
-            "in_progress": "🟡 Devam ediyor",
-            "resolved": "✅ Çözüldü",
-            "closed": "🔴 Kapatıldı"
-        }.get(help_request.get("status", "open"), "❓ Bilinmiyor")
+        status_text = _STATUS_TEXTS.get(help_request.get("status", "open"), "❓ Bilinmiyor")
         
         # Detaylı bilgi göster
         details_text = (
@@ -190,4 +217,4 @@ def setup_help_handlers(
             text=details_text
         )
         
-        logger.info(f"[i] Yardım detayları görüntülendi | Kullanıcı: {user_id} | Yardım ID: {help_id}")
+        logger.info("[i] Yardım detayları görüntülendi | Kullanıcı: %s | Yardım ID: %s", user_id, help_id)
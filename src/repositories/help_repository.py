@@ -2,9 +2,10 @@
 Yardım istekleri için repository.
 """
 
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence
 from src.repositories.base_repository import BaseRepository
 from src.core.logger import logger
+from src.core.exceptions import DatabaseError
 
 
 class HelpRepository(BaseRepository):
@@ -12,22 +13,105 @@ class HelpRepository(BaseRepository):
     Yardım istekleri için veritabanı işlemleri.
     """
     
+    # SQLite parametre limitini aşmamak için IN (...) sorgularındaki en fazla ID sayısı
+    IN_QUERY_CHUNK_SIZE = 500
+    
+    # iter_open_requests ile seçilebilecek kolonlar (SQL'e f-string ile girdiği için beyaz liste)
+    COLUMNS = frozenset({
+        "id", "requester_id", "topic", "description", "status", "helper_id", "channel_id",
+        "help_channel_id", "message_ts", "created_at", "resolved_at", "updated_at"
+    })
+    
     def __init__(self, db_client):
         super().__init__(db_client, "help_requests")
+        # Sabit sorgu bir kez oluşturulur (her çağrıda f-string formatlanmaz)
+        self._sql_open_requests = f"SELECT * FROM {self.table_name} WHERE status = 'open' ORDER BY created_at DESC LIMIT ?"
+        # created_at CURRENT_TIMESTAMP (UTC) ile yazılır, karşılaştırma da SQLite'ın UTC saatine göre yapılır
+        self._sql_expired_channels = (
+            f"SELECT id, help_channel_id FROM {self.table_name} "
+            f"WHERE status IN ('open', 'in_progress', 'resolved') AND help_channel_id IS NOT NULL "
+            f"AND created_at <= datetime('now', ?) AND created_at >= datetime('now', ?) "
+            f"ORDER BY created_at LIMIT ?"
+        )
     
     def get_open_requests(self, limit: int = 10) -> List[dict]:
         """Açık yardım isteklerini getirir."""
         try:
             with self.db_client.get_connection() as conn:
                 cursor = conn.cursor()
-                sql = f"SELECT * FROM {self.table_name} WHERE status = 'open' ORDER BY created_at DESC LIMIT ?"
-                cursor.execute(sql, (limit,))
+                cursor.execute(self._sql_open_requests, (limit,))
                 rows = cursor.fetchall()
                 return [dict(row) for row in rows]
         except Exception as e:
             logger.error(f"[X] {self.table_name}.get_open_requests hatası: {e}")
             return []
     
+    def iter_open_requests(
+        self,
+        columns: Sequence[str] = ("id", "topic", "created_at"),
+        limit: int = 10
+    ) -> Iterator[dict]:
+        """
+        Açık yardım isteklerini sadece istenen kolonlarla, satır satır döndürür (generator).
+        (status, created_at) index'i sayesinde sıralama için tam tablo taraması yapılmaz;
+        çağıran taraf erken çıkarsa kalan satırlar okunmaz.
+        """
+        unknown = set(columns) - self.COLUMNS
+        if not columns or unknown:
+            raise ValueError(f"Geçersiz kolon(lar): {sorted(unknown) or 'boş liste'}")
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                sql = f"SELECT {', '.join(columns)} FROM {self.table_name} WHERE status = 'open' ORDER BY created_at DESC LIMIT ?"
+                cursor.execute(sql, (limit,))
+                for row in cursor:
+                    yield dict(row)
+        except Exception as e:
+            logger.error(f"[X] {self.table_name}.iter_open_requests hatası: {e}")
+    
+    def get_expired_help_channels(self, lifetime_minutes: int, max_age_minutes: int = 24 * 60, limit: int = 100) -> List[dict]:
+        """
+        Açılışından bu yana lifetime_minutes geçmiş ve henüz kapatılmamış yardım kanallarını getirir.
+        max_age_minutes'tan eski istekler dönmez (eski kayıtlar toplu işlenmez, takılan kayıtlar sonsuza dek denenmez).
+        """
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    self._sql_expired_channels,
+                    (f"-{int(lifetime_minutes)} minutes", f"-{int(max_age_minutes)} minutes", limit)
+                )
+                return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"[X] {self.table_name}.get_expired_help_channels hatası: {e}")
+            return []
+    
+    def bulk_update_status(self, help_ids: Sequence[str], status: str) -> int:
+        """
+        Birden fazla yardım isteğinin durumunu tek transaction ve tek commit ile günceller.
+
+        Returns:
+            Güncellenen satır sayısı
+        """
+        if not help_ids:
+            return 0
+        ids = list(dict.fromkeys(help_ids))
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                updated = 0
+                for i in range(0, len(ids), self.IN_QUERY_CHUNK_SIZE):
+                    chunk = ids[i:i + self.IN_QUERY_CHUNK_SIZE]
+                    placeholders = ", ".join(["?"] * len(chunk))
+                    sql = f"UPDATE {self.table_name} SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE id IN ({placeholders})"
+                    cursor.execute(sql, [status, *chunk])
+                    updated += cursor.rowcount
+                conn.commit()
+                return updated
+        except Exception as e:
+            logger.error(f"[X] {self.table_name}.bulk_update_status hatası: {e}")
+            raise DatabaseError(str(e))
+    
     def get_user_requests(self, user_id: str) -> List[dict]:
         """Kullanıcının yardım isteklerini getirir."""
         return self.list(filters={"requester_id": user_id})
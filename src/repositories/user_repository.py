@@ -1,5 +1,8 @@
 import uuid
-from typing import Optional, Dict, Any
+import time
+import threading
+from datetime import date
+from typing import Optional, Dict, Any, List, Tuple
 from src.repositories.base_repository import BaseRepository
 from src.clients.database_client import DatabaseClient
 from src.core.logger import logger
@@ -8,24 +11,166 @@ from src.core.exceptions import DatabaseError
 class UserRepository(BaseRepository):
     """
     Kullanıcılar tablosuna özel veri erişim sınıfı.
+    Slack ID ile yapılan okumalar kısa süreli (TTL) bellek içi önbellekte tutulur.
     """
 
+    # Önbellek ayarları (kullanıcı verisi nadiren değişir, kısa TTL bayatlığı sınırlar)
+    CACHE_TTL_SECONDS = 300
+    CACHE_MAX_SIZE = 4096
+    # Tek bir IN (...) sorgusundaki maksimum parametre sayısı
+    IN_QUERY_CHUNK_SIZE = 500
+
     def __init__(self, db_client: DatabaseClient):
         super().__init__(db_client, "users")
+        # Sabit sorgular bir kez oluşturulur (her çağrıda f-string formatlanmaz)
+        self._sql_get_by_slack_id = f"SELECT * FROM {self.table_name} WHERE slack_id = ?"
+        self._sql_get_display_name = f"SELECT full_name FROM {self.table_name} WHERE slack_id = ?"
+        # birthday YYYY-MM-DD formatında; substr(birthday, 6, 5) = MM-DD
+        # (idx_users_birthday_md ifade index'i bu sorguyu tam tablo taraması olmadan karşılar)
+        self._sql_birthdays_today = f"""
+            SELECT slack_id,
+                   COALESCE(
+                       NULLIF(TRIM(
+                           COALESCE(first_name, '')
+                           || CASE WHEN COALESCE(middle_name, '') <> '' THEN ' ' || middle_name ELSE '' END
+                           || ' ' || COALESCE(surname, '')
+                       ), ''),
+                       full_name
+                   ) AS display_name,
+                   birthday
+            FROM {self.table_name}
+            WHERE substr(birthday, 6, 5) = ?
+              AND slack_id IS NOT NULL AND slack_id <> ''
+        """
+        self._user_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._name_cache: Dict[str, Tuple[float, str]] = {}
+        self._cache_lock = threading.Lock()
+
+    def _cache_get(self, cache: Dict[str, Tuple[float, Any]], key: str) -> Optional[Any]:
+        """Süresi dolmamış önbellek kaydını döndürür."""
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del cache[key]
+                return None
+            return value
+
+    def _cache_set(self, cache: Dict[str, Tuple[float, Any]], key: str, value: Any):
+        """Önbelleğe kayıt ekler; kapasite dolduysa en eski kaydı çıkarır."""
+        with self._cache_lock:
+            if key not in cache and len(cache) >= self.CACHE_MAX_SIZE:
+                cache.pop(next(iter(cache)))
+            cache[key] = (time.monotonic() + self.CACHE_TTL_SECONDS, value)
+
+    def invalidate_cache(self, slack_id: Optional[str] = None):
+        """Önbelleği temizler (slack_id verilirse sadece o kullanıcıyı)."""
+        with self._cache_lock:
+            if slack_id is None:
+                self._user_cache.clear()
+                self._name_cache.clear()
+            else:
+                self._user_cache.pop(slack_id, None)
+                self._name_cache.pop(slack_id, None)
+
+    def create(self, data: Dict[str, Any]) -> str:
+        """Yeni kullanıcı oluşturur ve ilgili önbellek kaydını düşürür."""
+        record_id = super().create(data)
+        if data.get("slack_id"):
+            self.invalidate_cache(data["slack_id"])
+        return record_id
+
+    def update(self, record_id: str, data: Dict[str, Any]) -> bool:
+        """ID ile kullanıcı günceller (slack_id bilinmediğinden tüm önbellek temizlenir)."""
+        result = super().update(record_id, data)
+        self.invalidate_cache()
+        return result
+
+    def delete(self, record_id: str) -> bool:
+        """ID ile kullanıcı siler (slack_id bilinmediğinden tüm önbellek temizlenir)."""
+        result = super().delete(record_id)
+        self.invalidate_cache()
+        return result
 
     def get_by_slack_id(self, slack_id: str) -> Optional[Dict[str, Any]]:
         """Slack ID'ye göre kullanıcı getirir."""
+        cached = self._cache_get(self._user_cache, slack_id)
+        if cached is not None:
+            return dict(cached)
+
         try:
             with self.db_client.get_connection() as conn:
                 cursor = conn.cursor()
-                sql = f"SELECT * FROM {self.table_name} WHERE slack_id = ?"
-                cursor.execute(sql, (slack_id,))
+                cursor.execute(self._sql_get_by_slack_id, (slack_id,))
                 row = cursor.fetchone()
-                return dict(row) if row else None
         except Exception as e:
             logger.error(f"[X] UserRepository.get_by_slack_id hatası: {e}")
             raise DatabaseError(str(e))
 
+        if not row:
+            return None
+        user = dict(row)
+        self._cache_set(self._user_cache, slack_id, user)
+        return dict(user)
+
+    def get_display_name(self, slack_id: str) -> Optional[str]:
+        """Slack ID'ye göre sadece kullanıcının tam adını getirir (log ve mesajlar için)."""
+        cached = self._cache_get(self._name_cache, slack_id)
+        if cached is not None:
+            return cached
+
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(self._sql_get_display_name, (slack_id,))
+                row = cursor.fetchone()
+        except Exception as e:
+            logger.error(f"[X] UserRepository.get_display_name hatası: {e}")
+            raise DatabaseError(str(e))
+
+        if not row or not row["full_name"]:
+            return None
+        self._cache_set(self._name_cache, slack_id, row["full_name"])
+        return row["full_name"]
+
+    def get_names_by_slack_ids(self, slack_ids: List[str]) -> Dict[str, str]:
+        """
+        Birden fazla Slack ID için tam adları tek sorguda getirir.
+        Önbellekte olanlar sorgulanmaz; bulunamayan ID'ler sonuçta yer almaz.
+        """
+        names: Dict[str, str] = {}
+        missing = []
+        for slack_id in dict.fromkeys(slack_ids):
+            cached = self._cache_get(self._name_cache, slack_id)
+            if cached is not None:
+                names[slack_id] = cached
+            else:
+                missing.append(slack_id)
+
+        if not missing:
+            return names
+
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                # SQLite parametre limitini aşmamak için parça parça sorgula
+                for i in range(0, len(missing), self.IN_QUERY_CHUNK_SIZE):
+                    chunk = missing[i:i + self.IN_QUERY_CHUNK_SIZE]
+                    placeholders = ", ".join(["?"] * len(chunk))
+                    sql = f"SELECT slack_id, full_name FROM {self.table_name} WHERE slack_id IN ({placeholders})"
+                    cursor.execute(sql, chunk)
+                    for row in cursor.fetchall():
+                        if row["full_name"]:
+                            names[row["slack_id"]] = row["full_name"]
+                            self._cache_set(self._name_cache, row["slack_id"], row["full_name"])
+        except Exception as e:
+            logger.error(f"[X] UserRepository.get_names_by_slack_ids hatası: {e}")
+            raise DatabaseError(str(e))
+
+        return names
+
     def update_by_slack_id(self, slack_id: str, data: Dict[str, Any]) -> bool:
         """Slack ID'ye göre kullanıcıyı günceller."""
         set_clause = ", ".join([f"{key} = ?" for key in data.keys()])
@@ -41,15 +186,62 @@ class UserRepository(BaseRepository):
         except Exception as e:
             logger.error(f"[X] UserRepository.update_by_slack_id hatası: {e}")
             raise DatabaseError(str(e))
+        finally:
+            self.invalidate_cache(slack_id)
+
+    def bulk_update_by_slack_id(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Birden fazla kullanıcıyı tek transaction ve tek commit ile günceller.
+        Her satır 'slack_id' ve güncellenecek alanları içerir. Aynı kolon setine sahip
+        satırlar tek bir SQL şablonu ile executemany üzerinden yazılır.
+
+        Returns:
+            Güncellenen satır sayısı
+        """
+        # Satırları kolon setine göre grupla (her grup için tek SQL şablonu)
+        groups: Dict[Tuple[str, ...], List[tuple]] = {}
+        for row in rows:
+            columns = tuple(sorted(key for key in row if key != "slack_id"))
+            if not row.get("slack_id") or not columns:
+                continue
+            values = tuple(row[column] for column in columns) + (row["slack_id"],)
+            groups.setdefault(columns, []).append(values)
+
+        if not groups:
+            return 0
+
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                updated = 0
+                for columns, values in groups.items():
+                    set_clause = ", ".join([f"{column} = ?" for column in columns])
+                    sql = f"UPDATE {self.table_name} SET {set_clause}, updated_at = CURRENT_TIMESTAMP WHERE slack_id = ?"
+                    cursor.executemany(sql, values)
+                    updated += cursor.rowcount
+                conn.commit()
+                logger.info(f"[+] Toplu kullanıcı güncellemesi tamamlandı: {updated} kayıt")
+                return updated
+        except Exception as e:
+            logger.error(f"[X] UserRepository.bulk_update_by_slack_id hatası: {e}")
+            raise DatabaseError(str(e))
+        finally:
+            for row in rows:
+                if row.get("slack_id"):
+                    self.invalidate_cache(row["slack_id"])
 
     def get_users_with_birthday_today(self) -> list:
-        """Bugün doğum günü olan kullanıcıları listeler."""
+        """
+        Bugün doğum günü olan kullanıcıları listeler.
+        Dönüş: [{"slack_id", "display_name", "birthday"}]; Slack ID'si olmayanlar SQL tarafında elenir.
+        display_name ad + (varsa) orta isim + soyadından oluşur, boşsa full_name kullanılır.
+        """
         try:
             with self.db_client.get_connection() as conn:
                 cursor = conn.cursor()
-                # SQLite'da ay ve gün kontrolü: strftime('%m-%d', birthday)
-                sql = f"SELECT * FROM {self.table_name} WHERE strftime('%m-%d', birthday) = strftime('%m-%d', 'now')"
-                cursor.execute(sql)
+                # Bugünün MM-DD değeri Python'da bir kez hesaplanıp parametre olarak bağlanır
+                today_md = date.today().strftime('%m-%d')
+                cursor.execute(self._sql_birthdays_today, (today_md,))
                 rows = cursor.fetchall()
                 return [dict(row) for row in rows]
         except Exception as e:
@@ -169,6 +361,7 @@ class UserRepository(BaseRepository):
                         continue
                 
                 conn.commit()
+                self.invalidate_cache()
                 logger.info(f"[+] CSV import tamamlandı. {count} kullanıcı eklendi.")
                 return count
                 
@@ -1,64 +1,121 @@
 import os
 import asyncio
-from typing import List, Dict, Any
-from datetime import datetime, date
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import date
 from src.core.logger import logger
 from src.core.exceptions import CemilBotError
 from src.commands import ChatManager
 from src.repositories import UserRepository
 from src.clients import CronClient
 
+# Kutlama başlık metni şablonları (sadece mention/yaş kısmı her çalıştırmada doldurulur)
+_SINGLE_HEADER_TEMPLATE = "🎉 *Mutlu Yıllar!* 🎉\n\n🎂 Sevgili <@{slack_id}> iyi ki doğdun{age_text}!"
+_MULTI_HEADER_PREFIX_TEMPLATE = "🎉 *Mutlu Yıllar!* 🎉\n\n🎂 Bugün {count} kişinin doğum günü!\n\n"
+_MULTI_HEADER_SUFFIX = " iyi ki doğdunuz!"
+_FALLBACK_TEXT = "🎂 Doğum Günü Kutlaması! 🎂"
+# Slack sınırları: section metni en fazla 3000 karakter, mesaj en fazla 50 blok olabilir
+_SECTION_TEXT_LIMIT = 3000
+_MAX_BLOCKS_PER_MESSAGE = 50
+
+# Kutlama mesajının sabit blokları (her çalıştırmada yeniden oluşturulmaz, değiştirilmemelidir)
+_HEADER_BLOCK = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "🎂 Doğum Günü Kutlaması 🎂",
+        "emoji": True
+    }
+}
+
+_FOOTER_BLOCK = {
+    "type": "section",
+    "text": {
+        "type": "mrkdwn",
+        "text": "🎁 Yeni yaşınızda sağlık, mutluluk ve başarılar dileriz!\n💝 Topluluğumuzun bir parçası olduğunuz için çok mutluyuz!"
+    }
+}
+
+_CONTEXT_BLOCK = {
+    "type": "context",
+    "elements": [
+        {
+            "type": "mrkdwn",
+            "text": "🎈 Cemil Bot ile gönderildi"
+        }
+    ]
+}
+
+
+def _pack_texts(parts: List[str], separator: str, max_chars: int) -> List[str]:
+    """Metin parçalarını sırayı koruyarak, her grup max_chars'ı aşmayacak şekilde separator ile birleştirir."""
+    chunks: List[str] = []
+    current: List[str] = []
+    length = 0
+    for part in parts:
+        added = len(part) + (len(separator) if current else 0)
+        if current and length + added > max_chars:
+            chunks.append(separator.join(current))
+            current, length, added = [], 0, len(part)
+        current.append(part)
+        length += added
+    if current:
+        chunks.append(separator.join(current))
+    return chunks
+
+
+def _section(text: str) -> Dict[str, Any]:
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+
 class BirthdayService:
     """
     Doğum günlerini takip eden ve günlük kutlamalar yapan servis.
     """
 
+    __slots__ = ("chat", "user_repo", "cron", "channel_id")
+
     def __init__(
         self, 
         chat_manager: ChatManager, 
         user_repo: UserRepository, 
-        cron_client: CronClient
+        cron_client: CronClient,
+        channel_id: Optional[str] = None
     ):
         self.chat = chat_manager
         self.user_repo = user_repo
         self.cron = cron_client
-        self.channel_id = os.environ.get("BIRTHDAY_CHANNEL_ID")
+        # Ortam değişkeni modül import'unda değil burada okunur: bot.py servisleri load_dotenv()'den önce import eder
+        self.channel_id = channel_id or os.environ.get("BIRTHDAY_CHANNEL_ID")
 
-    def _calculate_age(self, birthday_str: str) -> int:
-        """Doğum tarihinden yaşı hesaplar."""
+    def _calculate_age(self, birthday_str: str, today: Optional[Tuple[int, int, int]] = None) -> Optional[int]:
+        """
+        Doğum tarihinden yaşı hesaplar.
+        strptime yerine split + tamsayı karşılaştırması kullanılır; today (yıl, ay, gün) toplu işlemde bir kez verilir.
+        """
         try:
             if not birthday_str:
                 return None
             
             # YYYY-MM-DD formatından parse et
-            birth_date = datetime.strptime(birthday_str, '%Y-%m-%d').date()
-            today = date.today()
-            
-            # Yaş hesapla
-            age = today.year - birth_date.year
-            
-            # Henüz doğum günü gelmediyse 1 yaş eksilt
-            if (today.month, today.day) < (birth_date.month, birth_date.day):
-                age -= 1
+            year, month, day = birthday_str.split('-', 2)
+            birth = (int(year), int(month), int(day))
+            if today is None:
+                current = date.today()
+                today = (current.year, current.month, current.day)
             
-            return age
+            # Henüz doğum günü gelmediyse 1 yaş eksilt (bool -> 0/1)
+            return today[0] - birth[0] - ((today[1], today[2]) < (birth[1], birth[2]))
         except Exception as e:
-            logger.warning(f"[!] Yaş hesaplanamadı: {birthday_str} | Hata: {e}")
+            logger.warning("[!] Yaş hesaplanamadı: %s | Hata: %s", birthday_str, e)
             return None
 
-    def _format_user_name(self, user: Dict[str, Any]) -> str:
-        """Kullanıcı adını formatlar (orta isim dahil)."""
-        first_name = user.get('first_name', '')
-        middle_name = user.get('middle_name', '')
-        surname = user.get('surname', '')
-        
-        if middle_name:
-            return f"{first_name} {middle_name} {surname}".strip()
-        else:
-            return f"{first_name} {surname}".strip()
-
     async def check_and_celebrate(self):
         """Bugün doğanları bulur ve kutlar."""
+        # Kanal yoksa mesaj gönderilemez; sorgu ve blok hazırlığı hiç yapılmaz
+        if not self.channel_id:
+            logger.warning("[!] BIRTHDAY_CHANNEL_ID ayarlanmadığı için doğum günü kontrolü atlandı.")
+            return
+
         try:
             logger.info("[>] Günlük doğum günü kontrolü yapılıyor...")
             users = self.user_repo.get_users_with_birthday_today()
@@ -67,116 +124,71 @@ class BirthdayService:
                 logger.info("[i] Bugün doğum günü olan kimse bulunamadı.")
                 return
 
-            logger.info(f"[!] Bugün {len(users)} kişinin doğum günü!")
+            logger.info("[!] Bugün %s kişinin doğum günü!", len(users))
             
-            # Kullanıcı bilgilerini hazırla
-            birthday_users = []
-            for user in users:
-                slack_id = user.get('slack_id')
-                if not slack_id:
-                    logger.warning(f"[!] Slack ID bulunamadı: {user.get('full_name', 'Bilinmiyor')}")
-                    continue
-                
-                user_name = self._format_user_name(user)
-                if not user_name:
-                    user_name = user.get('full_name', 'Bilinmiyor')
-                
-                age = self._calculate_age(user.get('birthday'))
-                
-                birthday_users.append({
-                    'slack_id': slack_id,
-                    'name': user_name,
-                    'age': age
-                })
-            
-            if not birthday_users:
-                logger.warning("[!] Geçerli kullanıcı bulunamadı.")
-                return
+            # Kullanıcı bilgilerini hazırla (isim ve Slack ID filtresi SQL tarafında yapılır,
+            # bugünün tarihi tüm liste için bir kez hesaplanır)
+            current = date.today()
+            today = (current.year, current.month, current.day)
+            birthday_users = [
+                {
+                    'slack_id': user['slack_id'],
+                    'name': user.get('display_name') or 'Bilinmiyor',
+                    'age': self._calculate_age(user.get('birthday'), today)
+                }
+                for user in users
+            ]
 
-            # Mesaj blokları oluştur
-            blocks = []
-            
-            # Başlık bloğu
+            # Başlık bölümü; çok kişide mention listesi 3000 karakterlik section sınırına göre bölünür
             if len(birthday_users) == 1:
                 user = birthday_users[0]
                 age_text = f" {user['age']}. yaşını" if user['age'] else ""
-                header_text = f"🎉 *Mutlu Yıllar!* 🎉\n\n🎂 Sevgili <@{user['slack_id']}> iyi ki doğdun{age_text}!"
+                header_sections = [_section(_SINGLE_HEADER_TEMPLATE.format(slack_id=user['slack_id'], age_text=age_text))]
             else:
-                mentions = [f"<@{u['slack_id']}>" for u in birthday_users]
-                mentions_str = ", ".join(mentions)
-                header_text = f"🎉 *Mutlu Yıllar!* 🎉\n\n🎂 Bugün {len(birthday_users)} kişinin doğum günü!\n\n{mentions_str} iyi ki doğdunuz!"
-            
-            blocks.append({
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "🎂 Doğum Günü Kutlaması 🎂",
-                    "emoji": True
-                }
-            })
-            
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": header_text
-                }
-            })
-            
-            # Her kullanıcı için detay bloğu
-            for user in birthday_users:
-                age_info = f" ({user['age']}. yaş)" if user['age'] else ""
-                user_text = f"✨ <@{user['slack_id']}> - {user['name']}{age_info}"
-                
-                blocks.append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": user_text
-                    }
-                })
-            
-            # Alt mesaj bloğu
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "🎁 Yeni yaşınızda sağlık, mutluluk ve başarılar dileriz!\n💝 Topluluğumuzun bir parçası olduğunuz için çok mutluyuz!"
-                }
-            })
-            
-            # Footer
-            blocks.append({
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": "🎈 Cemil Bot ile gönderildi"
-                    }
-                ]
-            })
-
-            if self.channel_id:
-                self.chat.post_message(
+                prefix = _MULTI_HEADER_PREFIX_TEMPLATE.format(count=len(birthday_users))
+                mention_chunks = _pack_texts(
+                    [f"<@{u['slack_id']}>" for u in birthday_users],
+                    ", ",
+                    _SECTION_TEXT_LIMIT - len(prefix) - len(_MULTI_HEADER_SUFFIX)
+                )
+                mention_chunks[0] = prefix + mention_chunks[0]
+                mention_chunks[-1] += _MULTI_HEADER_SUFFIX
+                header_sections = [_section(text) for text in mention_chunks]
+
+            # Kullanıcı detay satırları da section sınırına göre gruplanır
+            user_lines = [
+                f"✨ <@{user['slack_id']}> - {user['name']}" + (f" ({user['age']}. yaş)" if user['age'] else "")
+                for user in birthday_users
+            ]
+            detail_sections = [_section(text) for text in _pack_texts(user_lines, "\n", _SECTION_TEXT_LIMIT)]
+
+            # Sabit bloklar modül seviyesinde bir kez oluşturulur, sadece dinamik kısımlar burada eklenir
+            blocks = [_HEADER_BLOCK, *header_sections, *detail_sections, _FOOTER_BLOCK, _CONTEXT_BLOCK]
+
+            # Genelde tek mesaj yeterlidir; bloklar 50 sınırını aşarsa sırayla birden fazla mesaja bölünür
+            for i in range(0, len(blocks), _MAX_BLOCKS_PER_MESSAGE):
+                await self.chat.enqueue_post(
                     channel=self.channel_id,
-                    text="🎂 Doğum Günü Kutlaması! 🎂",
-                    blocks=blocks
+                    text=_FALLBACK_TEXT,
+                    blocks=blocks[i:i + _MAX_BLOCKS_PER_MESSAGE]
                 )
-                logger.info(f"[+] Doğum günü mesajı gönderildi | Kanal: {self.channel_id} | {len(birthday_users)} kişi")
-            else:
-                logger.warning("[!] BIRTHDAY_CHANNEL_ID ayarlanmadığı için mesaj gönderilemedi.")
+            logger.info("[+] Doğum günü mesajı gönderildi | Kanal: %s | %s kişi", self.channel_id, len(birthday_users))
 
         except Exception as e:
-            logger.error(f"[X] BirthdayService.check_and_celebrate hatası: {e}", exc_info=True)
+            logger.error("[X] BirthdayService.check_and_celebrate hatası: %s", e, exc_info=True)
 
     def schedule_daily_check(self, hour: int = 9, minute: int = 0):
-        """Günlük kontrolü belirtilen saate planlar."""
+        """Günlük kontrolü belirtilen saate planlar (kanal ayarlı değilse planlanmaz)."""
+        if not self.channel_id:
+            logger.warning("[!] BIRTHDAY_CHANNEL_ID ayarlanmadığı için günlük doğum günü kontrolü planlanmadı.")
+            return
+
         try:
             self.cron.add_cron_job(
                 func=self.check_and_celebrate,
                 cron_expression={"hour": hour, "minute": minute},
                 job_id="daily_birthday_check"
             )
-            logger.info(f"[i] Günlük doğum günü kontrolü saat {hour:02d}:{minute:02d} için planlandı.")
+            logger.info("[i] Günlük doğum günü kontrolü saat %02d:%02d için planlandı.", hour, minute)
         except Exception as e:
-            logger.error(f"[X] Doğum günü planlama hatası: {e}")
+            logger.error("[X] Doğum günü planlama hatası: %s", e)
@@ -2,20 +2,71 @@
 Topluluk yardımlaşma servisi.
 """
 
+import time
+import asyncio
 from datetime import datetime
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Set, Tuple
 from src.core.logger import logger
-from src.core.exceptions import CemilBotError
+from src.core.exceptions import CemilBotError, SlackClientError
 from src.commands import ChatManager, ConversationManager, UserManager
 from src.repositories import HelpRepository, UserRepository
 from src.clients import CronClient, GroqClient
 
 
+@lru_cache(maxsize=2)
+def _format_minute(epoch_minute: int) -> str:
+    """Dakika bazlı zaman damgasını 'GG.AA.YYYY SS:DD' olarak biçimlendirir (aynı dakika içinde önbellekten döner)."""
+    return datetime.fromtimestamp(epoch_minute * 60).strftime('%d.%m.%Y %H:%M')
+
+
 class HelpService:
     """
     Topluluk yardımlaşma isteklerini yöneten servis.
     """
     
+    __slots__ = (
+        "chat", "conv", "user_manager", "repo", "user_repo", "groq", "cron_client", "workspace_owner_id",
+        "_owner_cache", "_pending_name_lookups", "_pending_invites", "_background_tasks"
+    )
+    
+    # Workspace owner/admin nadiren değişir; bir saat boyunca önbellekten döndürülür
+    OWNER_CACHE_TTL_SECONDS = 3600
+    OWNER_LOOKUP_PAGE_SIZE = 200
+    # İsim sorguları bu süre (saniye) boyunca biriktirilip tek IN (...) sorgusuyla çözülür
+    NAME_LOOKUP_WINDOW_SECONDS = 0.05
+    NAME_LOOKUP_MAX_BATCH = 50
+    # Aynı kanala bu süre (saniye) içinde gelen katılım davetleri tek conversations.invite çağrısında birleştirilir
+    INVITE_BATCH_WINDOW_SECONDS = 0.5
+    # Yardım kanalları açılıştan bu kadar dakika sonra kapatılır; süpürme görevi dakikada bir çalışır
+    CHANNEL_LIFETIME_MINUTES = 10
+    CLOSE_SWEEP_BATCH_SIZE = 100
+    # Bu süreden (dakika) eski istekler süpürülmez: ilk kurulumda geçmiş kayıtlar toplu kapatılmaz,
+    # geçici hatayla kapatılamayan kanallar da en fazla bu süre boyunca yeniden denenir
+    CLOSE_SWEEP_MAX_AGE_MINUTES = 24 * 60
+    # Aynı anda kapatılan kanal sayısı (Slack ve LLM hız limitlerini zorlamamak için)
+    CLOSE_SWEEP_CONCURRENCY = 10
+    # conversations.invite'ta kullanıcının zaten kanalda olduğunu belirten Slack hata kodları
+    _ALREADY_MEMBER_ERRORS = frozenset({"already_in_channel", "already_in_team", "cant_invite_self"})
+    # Kanal silinmiş/arşivlenmişse kapatma tekrar denense de başarılı olmaz; istek kapatıldı sayılır
+    _UNRECOVERABLE_CHANNEL_ERRORS = frozenset({"channel_not_found", "is_archived"})
+    
+    # Blok mesajlarının sabit parçaları (her istekte yeniden oluşturulmaz, değiştirilmemelidir)
+    _JOIN_BUTTON_TEXT = {"type": "plain_text", "text": "💚 Kanala Katıl", "emoji": True}
+    _DETAILS_BUTTON_TEXT = {"type": "plain_text", "text": "📋 Detaylar", "emoji": True}
+    _WELCOME_NOTICE = (
+        "Bu kanal 10 dakika sonra otomatik olarak kapatılacak. "
+        "Yardım etmek isteyenler 'Yardım Et' butonuna tıklayarak bu kanala katılabilir."
+    )
+    _CLOSED_NOTICE_BLOCKS = [{
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": "⏰ *Kanal Kapatıldı*\n\nBu yardım kanalı 10 dakika sonra otomatik olarak kapatıldı. "
+                    "Yardıma devam etmek isterseniz, yeni bir yardım isteği oluşturabilirsiniz."
+        }
+    }]
+    
     def __init__(
         self,
         chat_manager: ChatManager,
@@ -24,7 +75,8 @@ class HelpService:
         help_repo: HelpRepository,
         user_repo: UserRepository,
         groq_client: Optional[GroqClient] = None,
-        cron_client: Optional[CronClient] = None
+        cron_client: Optional[CronClient] = None,
+        workspace_owner_id: Optional[str] = None
     ):
         self.chat = chat_manager
         self.conv = conv_manager
@@ -33,32 +85,205 @@ class HelpService:
         self.user_repo = user_repo
         self.groq = groq_client
         self.cron_client = cron_client
+        # Ayarlarda owner verilmişse kullanıcı listesi hiç taranmaz
+        self.workspace_owner_id = workspace_owner_id
+        # (owner_id, önbelleğe alınma zamanı - time.monotonic)
+        self._owner_cache: Tuple[Optional[str], float] = (None, 0.0)
+        # Event loop başına bekleyen isim sorguları: {loop: [(slack_id, future), ...]}
+        self._pending_name_lookups: Dict[asyncio.AbstractEventLoop, List[Tuple[str, asyncio.Future]]] = {}
+        # Kanal başına bekleyen davetler: {(loop, kanal_id): ([slack_id, ...], future)}
+        self._pending_invites: Dict[Tuple[asyncio.AbstractEventLoop, str], Tuple[List[str], asyncio.Future]] = {}
+        # Sonucu beklenmeyen arka plan görevleri; referans tutulmazsa görev çöp toplayıcıya gidebilir
+        self._background_tasks: Set[asyncio.Task] = set()
     
     def _get_workspace_owner(self) -> Optional[str]:
-        """Workspace owner veya admin kullanıcıyı bulur."""
+        """
+        Workspace owner veya admin kullanıcıyı bulur.
+        Ayarlarda SLACK_WORKSPACE_OWNER_ID verilmişse doğrudan o döner.
+        Aksi halde sonuç OWNER_CACHE_TTL_SECONDS boyunca önbellekte tutulur; her istekte kullanıcı listesi çekilmez.
+        """
+        if self.workspace_owner_id:
+            return self.workspace_owner_id
+        
+        owner_id, cached_at = self._owner_cache
+        if cached_at and time.monotonic() - cached_at < self.OWNER_CACHE_TTL_SECONDS:
+            return owner_id
+
         try:
-            # Tüm kullanıcıları listele
-            response = self.user_manager.list_users(limit=1000)
-            if response.get("ok"):
-                members = response.get("members", [])
-                # Önce owner'ı bul
-                for member in members:
-                    if member.get("is_owner", False):
-                        owner_id = member.get("id")
-                        logger.info(f"[i] Workspace owner bulundu: {owner_id}")
-                        return owner_id
-                # Owner yoksa admin'i bul
-                for member in members:
-                    if member.get("is_admin", False):
-                        admin_id = member.get("id")
-                        logger.info(f"[i] Workspace admin bulundu: {admin_id}")
-                        return admin_id
-            logger.warning("[!] Workspace owner/admin bulunamadı")
-            return None
+            # Kullanıcılar sayfa sayfa gezilir; owner bulunduğu anda sonraki sayfalar istenmez.
+            # Tek geçişte owner aranır, ilk admin (sayfalar arasında) yedek olarak saklanır.
+            owner_id = None
+            first_admin = None
+            for member in self.user_manager.iter_all_users(page_size=self.OWNER_LOOKUP_PAGE_SIZE):
+                if member.get("is_owner"):
+                    owner_id = member.get("id")
+                    logger.info(f"[i] Workspace owner bulundu: {owner_id}")
+                    break
+                if first_admin is None and member.get("is_admin"):
+                    first_admin = member.get("id")
+            if not owner_id and first_admin:
+                owner_id = first_admin
+                logger.info(f"[i] Workspace admin bulundu: {owner_id}")
+            if not owner_id:
+                logger.warning("[!] Workspace owner/admin bulunamadı")
+            self._owner_cache = (owner_id, time.monotonic())
+            return owner_id
         except Exception as e:
+            # Hata sonuçları önbelleğe alınmaz, bir sonraki istekte tekrar denenir
             logger.error(f"[X] Workspace owner bulunurken hata: {e}")
             return None
     
+    @classmethod
+    def _build_welcome_blocks(cls, header_block: Dict[str, Any], short_id: str, requester_id: str, description: str) -> List[Dict[str, Any]]:
+        """Yardım kanalının açılış mesajı bloklarını oluşturur."""
+        return [
+            header_block,
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": f"*<@{requester_id}>* yardım istiyor:\n\n*{description}*\n\n{cls._WELCOME_NOTICE}"
+                }
+            },
+            {
+                "type": "context",
+                "elements": [
+                    {
+                        "type": "mrkdwn",
+                        "text": f"🆔 Yardım ID: `{short_id}...` | ⏰ Kanal 10 dakika sonra kapanacak"
+                    }
+                ]
+            }
+        ]
+    
+    @classmethod
+    def _build_request_blocks(cls, header_block: Dict[str, Any], help_id: str, short_id: str, requester_id: str, description: str) -> List[Dict[str, Any]]:
+        """Genel kanala gönderilen yardım isteği mesajının bloklarını oluşturur (pop-up butonları ile)."""
+        return [
+            header_block,
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": f"*<@{requester_id}>* yardım istiyor:\n\n{description}"
+                }
+            },
+            {
+                "type": "actions",
+                "elements": [
+                    {
+                        "type": "button",
+                        "text": cls._JOIN_BUTTON_TEXT,
+                        "style": "primary",
+                        "action_id": "help_join_channel",
+                        "value": help_id
+                    },
+                    {
+                        "type": "button",
+                        "text": cls._DETAILS_BUTTON_TEXT,
+                        "action_id": "help_details",
+                        "value": help_id
+                    }
+                ]
+            },
+            {
+                "type": "context",
+                "elements": [
+                    {
+                        "type": "mrkdwn",
+                        "text": f"🆔 ID: `{short_id}...` | 📅 {_format_minute(int(time.time()) // 60)} | ⏰ 10 dakika sonra kapanacak"
+                    }
+                ]
+            }
+        ]
+    
+    def _run_in_background(self, coro, description: str) -> asyncio.Task:
+        """Coroutine'i beklemeden çalıştırır; hata olursa sadece loglanır."""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._background_tasks.add(task)
+
+        def _on_done(t: asyncio.Task):
+            self._background_tasks.discard(t)
+            if not t.cancelled() and t.exception() is not None:
+                logger.warning(f"[!] Arka plan görevi başarısız ({description}): {t.exception()}")
+
+        task.add_done_callback(_on_done)
+        return task
+    
+    def refresh_owner(self):
+        """Workspace owner önbelleğini temizler; bir sonraki istekte owner yeniden aranır."""
+        self._owner_cache = (None, 0.0)
+    
+    async def _lookup_user_name(self, user_id: str) -> str:
+        """
+        Kullanıcının tam adını döndürür; bulunamazsa Slack ID döner.
+        Kısa bir pencere içinde gelen sorgular biriktirilir ve tek toplu sorguyla çözülür.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending_name_lookups.setdefault(loop, [])
+        pending.append((user_id, future))
+        if len(pending) >= self.NAME_LOOKUP_MAX_BATCH:
+            loop.create_task(self._flush_name_lookups(loop))
+        elif len(pending) == 1:
+            # Penceredeki ilk sorgu boşaltmayı planlar
+            loop.call_later(self.NAME_LOOKUP_WINDOW_SECONDS, lambda: loop.create_task(self._flush_name_lookups(loop)))
+        return await future
+    
+    async def _flush_name_lookups(self, loop: asyncio.AbstractEventLoop):
+        """Bekleyen isim sorgularını tek repository çağrısıyla çözer."""
+        batch = self._pending_name_lookups.pop(loop, [])
+        if not batch:
+            return
+        try:
+            names = await asyncio.to_thread(self.user_repo.get_names_by_slack_ids, [uid for uid, _ in batch])
+        except Exception as e:
+            logger.warning(f"[!] Toplu isim sorgusu başarısız, Slack ID kullanılacak: {e}")
+            names = {}
+        for uid, future in batch:
+            if not future.done():
+                future.set_result(names.get(uid) or uid)
+    
+    async def _schedule_invite(self, help_channel_id: str, user_id: str):
+        """
+        Kullanıcıyı yardım kanalına davet eder.
+        INVITE_BATCH_WINDOW_SECONDS içinde aynı kanala gelen davetler tek çağrıda gönderilir;
+        davet başarısız olursa hata bekleyen tüm çağıranlara iletilir.
+        """
+        loop = asyncio.get_running_loop()
+        key = (loop, help_channel_id)
+        pending = self._pending_invites.get(key)
+        if pending is None:
+            pending = ([], loop.create_future())
+            self._pending_invites[key] = pending
+            # Penceredeki ilk davet boşaltmayı planlar
+            loop.call_later(self.INVITE_BATCH_WINDOW_SECONDS, lambda: loop.create_task(self._flush_invites(key)))
+        user_ids, future = pending
+        if user_id not in user_ids:
+            user_ids.append(user_id)
+        # Aynı future birden fazla çağıran tarafından beklenir; iptal bir çağıranla sınırlı kalsın
+        return await asyncio.shield(future)
+    
+    async def _flush_invites(self, key: Tuple[asyncio.AbstractEventLoop, str]):
+        """Bir kanal için biriken davetleri tek conversations.invite çağrısıyla gönderir."""
+        user_ids, future = self._pending_invites.pop(key)
+        try:
+            result = await asyncio.to_thread(self.conv.invite_users, key[1], user_ids)
+        except Exception as e:
+            future.set_exception(e)
+            # Hata çağıranlarda ele alınır; future'ı bekleyen kalmadıysa uyarı loglanmasın
+            future.exception()
+        else:
+            future.set_result(result)
+    
+    async def _invite_to_help_channel(self, help_channel_id: str, user_ids: List[str]):
+        """Kullanıcıları yardım kanalına davet eder (senkron Slack çağrısı thread'de çalışır)."""
+        try:
+            await asyncio.to_thread(self.conv.invite_users, help_channel_id, user_ids)
+            logger.info(f"[+] Kullanıcılar kanala davet edildi: {user_ids}")
+        except Exception as e:
+            logger.warning(f"[!] Kullanıcılar davet edilemedi: {e}")
+    
     async def create_help_request(
         self,
         requester_id: str,
@@ -74,13 +299,17 @@ class HelpService:
         """
         try:
             # 0. Kullanıcıyı users tablosunda garanti altına al (foreign key için)
+            # Bu sorgunun sonucu log'daki isim için de kullanılır (ikinci bir sorgu yapılmaz)
+            requester_name = requester_id
             try:
                 user_record = self.user_repo.get_by_slack_id(requester_id)
-                if not user_record:
+                if user_record:
+                    requester_name = user_record.get('full_name') or requester_id
+                else:
                     # Slack'ten gerçek isim bilgisini almaya çalış
                     full_name = requester_id
                     try:
-                        user_info = self.user_manager.get_user_info(requester_id)
+                        user_info = await asyncio.to_thread(self.user_manager.get_user_info, requester_id)
                         full_name = user_info.get("real_name") or user_info.get("profile", {}).get("real_name") or requester_id
                     except Exception:
                         # Slack API'den bilgi alınamazsa, sadece Slack ID ile devam et
@@ -90,6 +319,7 @@ class HelpService:
                         "slack_id": requester_id,
                         "full_name": full_name
                     })
+                    requester_name = full_name
                     logger.info(f"[i] HelpService: Kullanıcı users tablosuna eklendi: {requester_id} ({full_name})")
             except Exception as user_err:
                 logger.warning(f"[!] HelpService: Kullanıcı kontrol/ekleme hatası: {user_err}")
@@ -103,164 +333,91 @@ class HelpService:
                 "status": "open"
             })
             
-            # 2. Kullanıcı bilgisini al
-            user_data = self.user_repo.get_by_slack_id(requester_id)
-            requester_name = user_data.get('full_name', requester_id) if user_data else requester_id
+            # Kısa ID kanal adı ve mesaj bloklarında ortak kullanılır
+            short_id = help_id[:8]
             
             logger.info(f"[>] Yardım isteği oluşturuldu | Kullanıcı: {requester_name} ({requester_id}) | Konu: {topic}")
             
+            # Başlık bloğu kanal açılış mesajı ve ana mesaj için ortaktır, bir kez oluşturulur
+            header_block = {
+                "type": "header",
+                "text": {"type": "plain_text", "text": f"🆘 Yardım İsteği: {topic}", "emoji": True}
+            }
+            
+            # Oluşturma sonrası alanlar biriktirilip sonda tek update ile yazılır
+            pending_updates: Dict[str, Any] = {}
+            
+            # Owner araması kanala bağlı değildir; kanal oluşturulurken arka planda başlatılır
+            owner_task = asyncio.ensure_future(asyncio.to_thread(self._get_workspace_owner))
+            
             # 3. Yeni yardım kanalı oluştur
-            channel_name = f"yardim-{help_id[:8]}"
+            channel_name = f"yardim-{short_id}"
             try:
-                help_channel = self.conv.create_channel(
+                help_channel = await asyncio.to_thread(
+                    self.conv.create_channel,
                     name=channel_name,
                     is_private=False
                 )
                 help_channel_id = help_channel["id"]
                 logger.info(f"[+] Yardım kanalı oluşturuldu: #{channel_name} (ID: {help_channel_id})")
                 
-                # Akademi owner'ı bul
-                owner_id = self._get_workspace_owner()
+                owner_id = await owner_task
                 
                 # Kanalı davet et: owner + requester
+                # (User token ile oluşturulan kanala bot da bu davetle eklenir; mesajlar davetten sonra gönderilmeli)
                 invite_users = [requester_id]
                 if owner_id and owner_id != requester_id:
                     invite_users.append(owner_id)
                 
-                if invite_users:
-                    try:
-                        self.conv.invite_users(help_channel_id, invite_users)
-                        logger.info(f"[+] Kullanıcılar kanala davet edildi: {invite_users}")
-                    except Exception as e:
-                        logger.warning(f"[!] Kullanıcılar davet edilemedi: {e}")
-                
-                # Kanal açılış mesajı gönder
-                welcome_blocks = [
-                    {
-                        "type": "header",
-                        "text": {
-                            "type": "plain_text",
-                            "text": f"🆘 Yardım İsteği: {topic}",
-                            "emoji": True
-                        }
-                    },
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": (
-                                f"*<@{requester_id}>* yardım istiyor:\n\n"
-                                f"*{description}*\n\n"
-                                f"Bu kanal 10 dakika sonra otomatik olarak kapatılacak. "
-                                f"Yardım etmek isteyenler 'Yardım Et' butonuna tıklayarak bu kanala katılabilir."
-                            )
-                        }
-                    },
-                    {
-                        "type": "context",
-                        "elements": [
-                            {
-                                "type": "mrkdwn",
-                                "text": f"🆔 Yardım ID: `{help_id[:8]}...` | ⏰ Kanal 10 dakika sonra kapanacak"
-                            }
-                        ]
-                    }
-                ]
+                await self._invite_to_help_channel(help_channel_id, invite_users)
                 
+                # Kanal açılış mesajı
+                # Sonucu kullanılmaz; davetten sonra arka planda gönderilir (hata olursa loglanır)
                 # Mesajlar bot token ile gönderilir (bot olarak görünür)
-                self.chat.post_message(
-                    channel=help_channel_id,
-                    text=f"🆘 Yardım İsteği: {topic}",
-                    blocks=welcome_blocks
+                welcome_blocks = self._build_welcome_blocks(header_block, short_id, requester_id, description)
+                self._run_in_background(
+                    self.chat.enqueue_post(
+                        channel=help_channel_id,
+                        text=f"🆘 Yardım İsteği: {topic}",
+                        blocks=welcome_blocks
+                    ),
+                    "kanal açılış mesajı"
                 )
                 
-                # Veritabanına help_channel_id kaydet
-                self.repo.update(help_id, {"help_channel_id": help_channel_id})
-                
-                # 10 dakika sonra kanalı kapatmak için scheduled task ekle
-                if self.cron_client:
-                    try:
-                        job_id = f"close_help_channel_{help_id}"
-                        self.cron_client.add_once_job(
-                            func=self._close_help_channel,
-                            delay_minutes=10,
-                            job_id=job_id,
-                            args=[help_id, help_channel_id]
-                        )
-                        logger.info(f"[+] Kanal kapatma görevi planlandı: {job_id} (10 dakika sonra)")
-                    except Exception as e:
-                        logger.warning(f"[!] Kanal kapatma görevi planlanamadı: {e}")
+                # help_channel_id, message_ts ile birlikte tek update'te kaydedilir.
+                # Kanal CHANNEL_LIFETIME_MINUTES sonra periyodik süpürme görevi tarafından kapatılır.
+                pending_updates["help_channel_id"] = help_channel_id
                 
             except Exception as e:
                 logger.error(f"[X] Yardım kanalı oluşturulamadı: {e}")
                 help_channel_id = None
+                # Kanal yoksa owner araması gereksizdir: sürüyorsa iptal edilir, bittiyse hatası okunur
+                # (aksi halde asyncio "Task exception was never retrieved" loglar)
+                if not owner_task.done():
+                    owner_task.cancel()
+                elif not owner_task.cancelled():
+                    owner_task.exception()
             
             # 4. Block mesajı oluştur (pop-up butonu ile)
-            blocks = [
-                {
-                    "type": "header",
-                    "text": {
-                        "type": "plain_text",
-                        "text": f"🆘 Yardım İsteği: {topic}",
-                        "emoji": True
-                    }
-                },
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"*<@{requester_id}>* yardım istiyor:\n\n{description}"
-                    }
-                },
-                {
-                    "type": "actions",
-                    "elements": [
-                        {
-                            "type": "button",
-                            "text": {
-                                "type": "plain_text",
-                                "text": "💚 Kanala Katıl",
-                                "emoji": True
-                            },
-                            "style": "primary",
-                            "action_id": "help_join_channel",
-                            "value": help_id
-                        },
-                        {
-                            "type": "button",
-                            "text": {
-                                "type": "plain_text",
-                                "text": "📋 Detaylar",
-                                "emoji": True
-                            },
-                            "action_id": "help_details",
-                            "value": help_id
-                        }
-                    ]
-                },
-                {
-                    "type": "context",
-                    "elements": [
-                        {
-                            "type": "mrkdwn",
-                            "text": f"🆔 ID: `{help_id[:8]}...` | 📅 {datetime.now().strftime('%d.%m.%Y %H:%M')} | ⏰ 10 dakika sonra kapanacak"
-                        }
-                    ]
-                }
-            ]
+            blocks = self._build_request_blocks(header_block, help_id, short_id, requester_id, description)
             
-            # 5. Mesajı kanala gönder
-            response = self.chat.post_message(
-                channel=channel_id,
-                text=f"🆘 Yardım İsteği: {topic}",
-                blocks=blocks
-            )
-            
-            # 6. Message TS'yi kaydet (güncelleme için)
-            if response.get("ok"):
-                message_ts = response.get("ts")
-                self.repo.update(help_id, {"message_ts": message_ts})
-                logger.info(f"[+] Yardım isteği mesajı gönderildi | Kanal: {channel_id} | TS: {message_ts}")
+            try:
+                # 5. Mesajı kanala gönder
+                response = await self.chat.enqueue_post(
+                    channel=channel_id,
+                    text=f"🆘 Yardım İsteği: {topic}",
+                    blocks=blocks
+                )
+                
+                # 6. Message TS'yi kaydet (güncelleme için)
+                if response.get("ok"):
+                    message_ts = response.get("ts")
+                    pending_updates["message_ts"] = message_ts
+                    logger.info(f"[+] Yardım isteği mesajı gönderildi | Kanal: {channel_id} | TS: {message_ts}")
+            finally:
+                # Mesaj gönderilemese bile help_channel_id kaydedilir
+                if pending_updates:
+                    self.repo.update(help_id, pending_updates)
             
             return help_id
             
@@ -291,15 +448,14 @@ class HelpService:
             if not help_channel_id:
                 return {"success": False, "message": "❌ Yardım kanalı bulunamadı."}
             
-            # 4. Kullanıcı bilgisini al
-            user_data = self.user_repo.get_by_slack_id(user_id)
-            user_name = user_data.get('full_name', user_id) if user_data else user_id
+            # 4. Kullanıcı bilgisini al (eşzamanlı tıklamalar tek sorguda toplanır)
+            user_name = await self._lookup_user_name(user_id)
             
             logger.info(f"[>] Kanala katılma isteği | Kullanıcı: {user_name} ({user_id}) | Yardım ID: {help_id}")
             
             # 5. Kullanıcının zaten kanalda olup olmadığını kontrol et
             try:
-                channel_members = self.conv.get_members(help_channel_id)
+                channel_members = await asyncio.to_thread(self.conv.get_members, help_channel_id)
                 if user_id in channel_members:
                     logger.info(f"[i] Kullanıcı zaten kanalda: {user_id} | Kanal: {help_channel_id}")
                     return {
@@ -313,12 +469,14 @@ class HelpService:
             
             # 6. Kullanıcıyı kanala davet et
             try:
-                self.conv.invite_users(help_channel_id, [user_id])
+                await self._schedule_invite(help_channel_id, user_id)
                 logger.info(f"[+] Kullanıcı kanala davet edildi: {user_id} | Kanal: {help_channel_id}")
                 
                 # Yardım kanalına bilgilendirme mesajı gönder (sadece yeni katılımda)
+                # Kullanıcının beklemesine gerek yok; mesaj arka planda gönderilir
                 # Mesajlar bot token ile gönderilir (bot olarak görünür)
-                self.chat.post_message(
+                self._run_in_background(asyncio.to_thread(
+                    self.chat.post_message,
                     channel=help_channel_id,
                     text=f"✅ <@{user_id}> kanala katıldı!",
                     blocks=[{
@@ -328,7 +486,7 @@ class HelpService:
                             "text": f"✅ *<@{user_name}>* kanala katıldı ve yardım etmek istiyor! 🎉"
                         }
                     }]
-                )
+                ), "katılım bildirimi")
                 
                 return {
                     "success": True,
@@ -336,26 +494,77 @@ class HelpService:
                     "channel_id": help_channel_id,
                     "already_joined": False
                 }
-            except Exception as e:
-                error_msg = str(e).lower()
-                if "already_in_channel" in error_msg or "already_in team" in error_msg or "cant_invite_self" in error_msg:
-                    logger.info(f"[i] Kullanıcı zaten kanalda (hata mesajından): {user_id}")
+            except SlackClientError as e:
+                if e.extra.get("error") in self._ALREADY_MEMBER_ERRORS:
+                    logger.info(f"[i] Kullanıcı zaten kanalda (hata kodundan): {user_id}")
                     return {
                         "success": True,
                         "message": f"✅ Zaten kanaldasınız! <#{help_channel_id}> kanalına gidebilirsiniz.",
                         "channel_id": help_channel_id,
                         "already_joined": True
                     }
-                else:
-                    logger.warning(f"[!] Kullanıcı kanala davet edilemedi: {e}")
-                    return {"success": False, "message": "❌ Kanala katılamadınız. Lütfen tekrar deneyin."}
+                logger.warning(f"[!] Kullanıcı kanala davet edilemedi: {e}")
+                return {"success": False, "message": "❌ Kanala katılamadınız. Lütfen tekrar deneyin."}
+            except Exception as e:
+                logger.warning(f"[!] Kullanıcı kanala davet edilemedi: {e}")
+                return {"success": False, "message": "❌ Kanala katılamadınız. Lütfen tekrar deneyin."}
             
         except Exception as e:
             logger.error(f"[X] HelpService.join_help_channel hatası: {e}", exc_info=True)
             return {"success": False, "message": "Kanala katılırken bir hata oluştu."}
     
-    async def _close_help_channel(self, help_id: str, help_channel_id: str):
-        """Yardım kanalını kapatır, mesajları analiz eder ve DM/Admin'e gönderir (10 dakika sonra otomatik çağrılır)."""
+    def schedule_close_sweep(self):
+        """
+        Süresi dolan yardım kanallarını kapatan görevi dakikada bir çalışacak şekilde planlar.
+        Kapatılacak kanallar veritabanından okunduğu için yeniden başlatmada bekleyen kapatmalar kaybolmaz.
+        """
+        if not self.cron_client:
+            logger.warning("[!] CronClient yok, yardım kanalı kapatma görevi planlanmadı.")
+            return
+        try:
+            self.cron_client.add_cron_job(
+                func=self._sweep_expired_help_channels,
+                cron_expression={"minute": "*/1"},
+                job_id="sweep_help_channels"
+            )
+            logger.info("[+] Yardım kanalı kapatma görevi başlatıldı (her 1 dakikada bir)")
+        except Exception as e:
+            logger.warning(f"[!] Yardım kanalı kapatma görevi planlanamadı: {e}")
+    
+    async def _sweep_expired_help_channels(self):
+        """
+        Açılış süresi dolmuş yardım kanallarını eşzamanlı kapatır (en fazla CLOSE_SWEEP_CONCURRENCY adet).
+        Kapatılan isteklerin durumu sonda tek UPDATE ile yazılır.
+        """
+        expired = self.repo.get_expired_help_channels(
+            self.CHANNEL_LIFETIME_MINUTES,
+            max_age_minutes=self.CLOSE_SWEEP_MAX_AGE_MINUTES,
+            limit=self.CLOSE_SWEEP_BATCH_SIZE
+        )
+        if not expired:
+            return
+        logger.info(f"[>] Süresi dolan {len(expired)} yardım kanalı kapatılıyor")
+        
+        semaphore = asyncio.Semaphore(self.CLOSE_SWEEP_CONCURRENCY)
+        
+        async def close(row):
+            async with semaphore:
+                return await self._close_help_channel(row["id"], row["help_channel_id"])
+        
+        results = await asyncio.gather(*(close(row) for row in expired))
+        closed_ids = [row["id"] for row, closed in zip(expired, results) if closed]
+        if closed_ids:
+            self.repo.bulk_update_status(closed_ids, "closed")
+            logger.info(f"[+] {len(closed_ids)} yardım isteği kapatıldı olarak işaretlendi")
+    
+    async def _close_help_channel(self, help_id: str, help_channel_id: str) -> bool:
+        """
+        Yardım kanalını kapatır, mesajları analiz eder ve DM/Admin'e gönderir (süpürme görevi tarafından çağrılır).
+        Durum güncellemesi çağırana bırakılır; süpürme görevi kapatılanları tek toplu UPDATE ile yazar.
+        
+        Returns:
+            Kapatma adımları tamamlandıysa ya da kanal artık yoksa/arşivlenmişse True (arşivleme başarısız olsa bile)
+        """
         try:
             logger.info(f"[>] Yardım kanalı kapatılıyor | Help ID: {help_id} | Kanal: {help_channel_id}")
             
@@ -363,10 +572,18 @@ class HelpService:
             help_request = self.repo.get(help_id)
             if not help_request:
                 logger.error(f"[X] Yardım isteği bulunamadı: {help_id}")
-                return
+                return False
             
             # 2. Sohbet geçmişini al
-            messages = self.conv.get_history(channel_id=help_channel_id, limit=100)
+            try:
+                messages = await asyncio.to_thread(self.conv.get_history, channel_id=help_channel_id, limit=100)
+            except SlackClientError as e:
+                if e.extra.get("error") in self._UNRECOVERABLE_CHANNEL_ERRORS:
+                    logger.warning(
+                        f"[!] Yardım kanalına erişilemiyor ({e.extra['error']}), kapatıldı olarak işaretleniyor | Help ID: {help_id}"
+                    )
+                    return True
+                raise
             
             # 3. Mesajları temizle (bot mesajları hariç)
             user_messages = []
@@ -417,25 +634,27 @@ class HelpService:
             if help_request.get("helper_id") and help_request["helper_id"] not in all_participants:
                 all_participants.append(help_request["helper_id"])
             
+            # DM içeriği tüm katılımcılar için aynıdır, döngü dışında bir kez oluşturulur
+            dm_blocks = [
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": (
+                            f"🆘 *Yardım Kanalı Sonlandı*\n\n"
+                            f"*Konu:* {help_request['topic']}\n"
+                            f"*Kanal:* <#{help_channel_id}>\n\n"
+                            f"*📊 Sohbet Analizi:*\n{detailed_analysis}\n\n"
+                            f"Yeni bir yardım isteği için `/yardim-iste` komutunu kullanabilirsiniz!"
+                        )
+                    }
+                }
+            ]
             for participant_id in all_participants:
                 try:
-                    dm_channel = self.conv.open_conversation(users=[participant_id])
-                    dm_blocks = [
-                        {
-                            "type": "section",
-                            "text": {
-                                "type": "mrkdwn",
-                                "text": (
-                                    f"🆘 *Yardım Kanalı Sonlandı*\n\n"
-                                    f"*Konu:* {help_request['topic']}\n"
-                                    f"*Kanal:* <#{help_channel_id}>\n\n"
-                                    f"*📊 Sohbet Analizi:*\n{detailed_analysis}\n\n"
-                                    f"Yeni bir yardım isteği için `/yardim-iste` komutunu kullanabilirsiniz!"
-                                )
-                            }
-                        }
-                    ]
-                    self.chat.post_message(
+                    dm_channel = await asyncio.to_thread(self.conv.open_conversation, users=[participant_id])
+                    await asyncio.to_thread(
+                        self.chat.post_message,
                         channel=dm_channel["id"],
                         text="🆘 Yardım Kanalı Sonlandı",
                         blocks=dm_blocks
@@ -466,7 +685,7 @@ class HelpService:
                     f"*📊 Detaylı Analiz:*\n{detailed_analysis}"
                 )
                 try:
-                    self.chat.post_message(channel=admin_channel, text=admin_msg)
+                    await asyncio.to_thread(self.chat.post_message, channel=admin_channel, text=admin_msg)
                     logger.info(f"[+] Admin kanalına özet gönderildi | Kanal: {admin_channel}")
                 except Exception as e:
                     logger.warning(f"[!] Admin kanalına özet gönderilemedi: {e}")
@@ -474,37 +693,32 @@ class HelpService:
             # 7. Kanal kapatıldı mesajı gönder (eğer hala açıksa)
             try:
                 # Mesajlar bot token ile gönderilir (bot olarak görünür)
-                self.chat.post_message(
+                await asyncio.to_thread(
+                    self.chat.post_message,
                     channel=help_channel_id,
                     text="⏰ Bu yardım kanalı 10 dakika sonra otomatik olarak kapatıldı.",
-                    blocks=[{
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": "⏰ *Kanal Kapatıldı*\n\nBu yardım kanalı 10 dakika sonra otomatik olarak kapatıldı. "
-                                    "Yardıma devam etmek isterseniz, yeni bir yardım isteği oluşturabilirsiniz."
-                        }
-                    }]
+                    blocks=self._CLOSED_NOTICE_BLOCKS
                 )
             except Exception as e:
                 logger.debug(f"[i] Kanal zaten kapatılmış, mesaj gönderilemedi: {e}")
             
             # 8. Kanalı arşivle (kapat)
             try:
-                success = self.conv.archive_channel(help_channel_id)
+                success = await asyncio.to_thread(self.conv.archive_channel, help_channel_id)
                 if success:
-                    # Yardım isteğini kapatılmış olarak işaretle
-                    self.repo.update(help_id, {"status": "closed"})
                     logger.info(f"[+] Yardım kanalı arşivlendi (kapatıldı) | Help ID: {help_id}")
                 else:
                     logger.warning(f"[!] Yardım kanalı arşivlenemedi | Help ID: {help_id}")
             except Exception as e:
                 logger.warning(f"[!] Yardım kanalı arşivlenirken hata: {e}")
-                # Hata olsa bile durumu güncelle
-                self.repo.update(help_id, {"status": "closed"})
+            
+            # Arşivleme başarısız olsa bile True döner ve durum güncellenir; aksi halde süpürme görevi
+            # aynı kanalı her dakika yeniden işler ve katılımcılara tekrar DM gönderir
+            return True
                 
         except Exception as e:
             logger.error(f"[X] Yardım kanalı kapatılırken hata: {e}", exc_info=True)
+            return False
     
     def get_help_details(self, help_id: str) -> Dict[str, Any]:
         """Yardım isteği detaylarını getirir."""
@@ -88,7 +88,7 @@ class CoffeeMatchService:
             
             # Partner ismini al
             try:
-                partner_info = self.chat.client.users_info(user=partner_id)
+                partner_info = await asyncio.to_thread(self.chat.client.users_info, user=partner_id)
                 partner_name = partner_info.get("user", {}).get("real_name", partner_id) if partner_info.get("ok") else partner_id
             except Exception as e:
                 logger.warning(f"[!] Partner ismi alınamadı: {e}")
@@ -175,18 +175,20 @@ class CoffeeMatchService:
         """
         İki kullanıcıyı eşleştirir, grup açar ve buzları eritir.
         """
+        # Tanışma mesajı kanala bağlı değildir; LLM yanıtı isim sorguları ve kanal kurulumu sırasında üretilir
+        ice_breaker_task = asyncio.ensure_future(self._generate_ice_breaker(user_id1, user_id2))
         try:
             # Kullanıcı isimlerini al
             if not user_name1:
                 try:
-                    user_info1 = self.chat.client.users_info(user=user_id1)
+                    user_info1 = await asyncio.to_thread(self.chat.client.users_info, user=user_id1)
                     user_name1 = user_info1.get("user", {}).get("real_name", user_id1) if user_info1.get("ok") else user_id1
                 except:
                     user_name1 = user_id1
             
             if not user_name2:
                 try:
-                    user_info2 = self.chat.client.users_info(user=user_id2)
+                    user_info2 = await asyncio.to_thread(self.chat.client.users_info, user=user_id2)
                     user_name2 = user_info2.get("user", {}).get("real_name", user_id2) if user_info2.get("ok") else user_id2
                 except:
                     user_name2 = user_id2
@@ -205,7 +207,8 @@ class CoffeeMatchService:
             channel_suffix = str(uuid.uuid4())[:8]
             channel_name = f"kahve-{channel_suffix}"
             try:
-                coffee_channel = self.conv.create_channel(
+                coffee_channel = await asyncio.to_thread(
+                    self.conv.create_channel,
                     name=channel_name,
                     is_private=True  # Private channel
                 )
@@ -214,7 +217,7 @@ class CoffeeMatchService:
                 
                 # Her iki kullanıcıyı kanala davet et
                 try:
-                    self.conv.invite_users(coffee_channel_id, [user_id1, user_id2])
+                    await asyncio.to_thread(self.conv.invite_users, coffee_channel_id, [user_id1, user_id2])
                     logger.info(f"[+] Kullanıcılar kanala davet edildi: {user_id1}, {user_id2}")
                 except Exception as e:
                     logger.warning(f"[!] Kullanıcılar davet edilemedi: {e}")
@@ -226,16 +229,8 @@ class CoffeeMatchService:
                 logger.error(f"[X] Kahve kanalı oluşturulamadı: {e}")
                 raise CemilBotError(f"Kahve kanalı oluşturulamadı: {e}")
 
-            # 3. Ice Breaker mesajı oluştur
-            system_prompt = (
-                "Sen Cemil'sin, bir topluluk asistanısın. Görevin birbiriyle eşleşen iki iş arkadaşı için "
-                "kısa, eğlenceli ve samimi bir tanışma mesajı yazmak. "
-                "ÖNEMLİ: Hiçbir emoji veya ASCII olmayan karakter kullanma. "
-                "Sadece ASCII (Harfler, sayılar ve [i], [c], [>], == gibi işaretler) kullan."
-            )
-            user_prompt = f"Şu iki kullanıcı az önce kahve için eşleşti: <@{user_id1}> ve <@{user_id2}>. Onlara güzel bir selam ver."
-            
-            ice_breaker = await self.groq.quick_ask(system_prompt, user_prompt)
+            # 3. Ice Breaker mesajı (kanal kurulurken üretimi başlamıştı)
+            ice_breaker = await ice_breaker_task
 
             # 3. Kanal açılış mesajı gönder
             welcome_blocks = [
@@ -271,7 +266,8 @@ class CoffeeMatchService:
             ]
             
             # Mesajlar bot token ile gönderilir (bot olarak görünür)
-            self.chat.post_message(
+            await asyncio.to_thread(
+                self.chat.post_message,
                 channel=coffee_channel_id,
                 text="☕ Kahve Eşleşmesi",
                 blocks=welcome_blocks
@@ -289,6 +285,24 @@ class CoffeeMatchService:
         except Exception as e:
             logger.error(f"[X] CoffeeMatchService.start_match hatası: {e}")
             raise CemilBotError(f"Eşleşme başlatılamadı: {e}")
+        finally:
+            # Kurulum erken başarısız olduysa yanıtı artık kullanılmayacak LLM isteği iptal edilir;
+            # istek zaten hatayla bittiyse hata okunur (aksi halde asyncio "Task exception was never retrieved" loglar)
+            if not ice_breaker_task.done():
+                ice_breaker_task.cancel()
+            elif not ice_breaker_task.cancelled():
+                ice_breaker_task.exception()
+
+    async def _generate_ice_breaker(self, user_id1: str, user_id2: str) -> str:
+        """Eşleşen iki kullanıcı için LLM ile kısa bir tanışma mesajı üretir."""
+        system_prompt = (
+            "Sen Cemil'sin, bir topluluk asistanısın. Görevin birbiriyle eşleşen iki iş arkadaşı için "
+            "kısa, eğlenceli ve samimi bir tanışma mesajı yazmak. "
+            "ÖNEMLİ: Hiçbir emoji veya ASCII olmayan karakter kullanma. "
+            "Sadece ASCII (Harfler, sayılar ve [i], [c], [>], == gibi işaretler) kullan."
+        )
+        user_prompt = f"Şu iki kullanıcı az önce kahve için eşleşti: <@{user_id1}> ve <@{user_id2}>. Onlara güzel bir selam ver."
+        return await self.groq.quick_ask(system_prompt, user_prompt)
 
     async def close_match(self, coffee_channel_id: str, match_id: str):
         """Sohbet özetini çıkarır, admini bilgilendirir ve private kanalı kapatır (yardım servisi ile aynı mantık)."""
@@ -300,12 +314,12 @@ class CoffeeMatchService:
                 return
             
             try:
-                user_info1 = self.chat.client.users_info(user=match_data['user1_id'])
+                user_info1 = await asyncio.to_thread(self.chat.client.users_info, user=match_data['user1_id'])
                 user_name1 = user_info1.get("user", {}).get("real_name", match_data['user1_id']) if user_info1.get("ok") else match_data['user1_id']
             except:
                 user_name1 = match_data['user1_id']
             try:
-                user_info2 = self.chat.client.users_info(user=match_data['user2_id'])
+                user_info2 = await asyncio.to_thread(self.chat.client.users_info, user=match_data['user2_id'])
                 user_name2 = user_info2.get("user", {}).get("real_name", match_data['user2_id']) if user_info2.get("ok") else match_data['user2_id']
             except:
                 user_name2 = match_data['user2_id']
@@ -313,7 +327,7 @@ class CoffeeMatchService:
             logger.info(f"[>] Kahve kanalı kapatılıyor | Kanal: {coffee_channel_id} | {user_name1} ({match_data['user1_id']}) & {user_name2} ({match_data['user2_id']})")
             
             # 1. Sohbet geçmişini al
-            messages = self.conv.get_history(channel_id=coffee_channel_id, limit=50)
+            messages = await asyncio.to_thread(self.conv.get_history, channel_id=coffee_channel_id, limit=50)
             
             # 2. Mesajları temizle
             user_messages = []
@@ -372,8 +386,9 @@ class CoffeeMatchService:
             
             try:
                 # Kullanıcı 1'e DM gönder
-                dm_channel1 = self.conv.open_conversation(users=[match_data['user1_id']])
-                self.chat.post_message(
+                dm_channel1 = await asyncio.to_thread(self.conv.open_conversation, users=[match_data['user1_id']])
+                await asyncio.to_thread(
+                    self.chat.post_message,
                     channel=dm_channel1["id"],
                     text="☕ Kahve Eşleşmesi Sonlandı",
                     blocks=dm_blocks
@@ -384,8 +399,9 @@ class CoffeeMatchService:
             
             try:
                 # Kullanıcı 2'ye DM gönder
-                dm_channel2 = self.conv.open_conversation(users=[match_data['user2_id']])
-                self.chat.post_message(
+                dm_channel2 = await asyncio.to_thread(self.conv.open_conversation, users=[match_data['user2_id']])
+                await asyncio.to_thread(
+                    self.chat.post_message,
                     channel=dm_channel2["id"],
                     text="☕ Kahve Eşleşmesi Sonlandı",
                     blocks=dm_blocks
@@ -404,10 +420,11 @@ class CoffeeMatchService:
                     f"== Kısa Özet: {summary}\n\n"
                     f"*📊 Detaylı Analiz:*\n{detailed_analysis}"
                 )
-                self.chat.post_message(channel=self.admin_channel, text=admin_msg)
+                await asyncio.to_thread(self.chat.post_message, channel=self.admin_channel, text=admin_msg)
 
             # 8. Kapanış mesajı gönder (private channel'da)
-            self.chat.post_message(
+            await asyncio.to_thread(
+                self.chat.post_message,
                 channel=coffee_channel_id,
                 text="⏰ Bu kahve kanalı 5 dakika sonra otomatik olarak kapatıldı.",
                 blocks=[{
@@ -422,7 +439,7 @@ class CoffeeMatchService:
             
             # 9. Kanalı arşivle (kapat)
             try:
-                success = self.conv.archive_channel(coffee_channel_id)
+                success = await asyncio.to_thread(self.conv.archive_channel, coffee_channel_id)
                 if success:
                     logger.info(f"[+] Kahve kanalı arşivlendi (kapatıldı) | Kanal: {coffee_channel_id}")
                 else:
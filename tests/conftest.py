@@ -21,6 +21,17 @@ def temp_db():
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+@pytest.fixture
+def db_client(temp_db):
+    """Geçici veritabanına bağlı yeni bir DatabaseClient döndürür (singleton örneği test sonunda temizlenir)."""
+    from src.clients.database_client import DatabaseClient
+    from src.core.singleton import SingletonMeta
+
+    SingletonMeta._instances.pop(DatabaseClient, None)
+    yield DatabaseClient(db_path=temp_db)
+    SingletonMeta._instances.pop(DatabaseClient, None)
+
+
 @pytest.fixture
 def temp_knowledge_base():
     """Geçici knowledge base klasörü oluşturur."""
@@ -0,0 +1,186 @@
+"""
+Doğum günü servisi testleri.
+"""
+
+import pytest
+from datetime import date
+from src.services.birthday_service import BirthdayService
+
+
+class FakeChat:
+    """Gönderilen mesajları kaydeden sahte ChatManager."""
+
+    def __init__(self):
+        self.messages = []
+
+    def post_message(self, channel, text, blocks=None, **kwargs):
+        self.messages.append({"channel": channel, "text": text, "blocks": blocks})
+        return {"ok": True, "ts": "1.0"}
+
+    async def enqueue_post(self, channel, text, blocks=None, **kwargs):
+        return self.post_message(channel, text, blocks=blocks, **kwargs)
+
+
+class FakeUserRepo:
+    """Sabit doğum günü listesi döndüren sahte UserRepository."""
+
+    def __init__(self, users):
+        self.users = users
+
+    def get_users_with_birthday_today(self):
+        return self.users
+
+
+@pytest.fixture
+def birthday_channel(monkeypatch):
+    monkeypatch.setenv("BIRTHDAY_CHANNEL_ID", "CBDAY")
+
+
+class TestCheckAndCelebrate:
+    """check_and_celebrate testleri."""
+
+    async def test_single_message_with_all_users(self, birthday_channel):
+        """Tüm doğum günleri tek mesajda gönderilir."""
+        chat = FakeChat()
+        users = [
+            {"slack_id": "U1", "display_name": "Ali Veli", "birthday": "1990-01-01"},
+            {"slack_id": "U2", "display_name": "Ayşe Nur Kaya", "birthday": None},
+        ]
+        service = BirthdayService(chat, FakeUserRepo(users), cron_client=None)
+
+        await service.check_and_celebrate()
+
+        assert len(chat.messages) == 1
+        message = chat.messages[0]
+        assert message["channel"] == "CBDAY"
+        texts = [block.get("text", {}).get("text", "") for block in message["blocks"]]
+        assert "<@U1>, <@U2> iyi ki doğdunuz!" in texts[1]
+        lines = texts[2].split("\n")
+        assert lines[0].startswith("✨ <@U1> - Ali Veli (")
+        assert lines[1] == "✨ <@U2> - Ayşe Nur Kaya"
+
+    async def test_many_users_fit_one_message(self, birthday_channel):
+        """Çok sayıda kişi tek mesajda ve Slack'in 50 blok sınırı içinde gönderilir."""
+        chat = FakeChat()
+        users = [{"slack_id": f"U{i}", "display_name": f"Kişi {i}", "birthday": None} for i in range(120)]
+        service = BirthdayService(chat, FakeUserRepo(users), cron_client=None)
+
+        await service.check_and_celebrate()
+
+        assert len(chat.messages) == 1
+        blocks = chat.messages[0]["blocks"]
+        assert len(blocks) <= 50
+        assert sum(block.get("text", {}).get("text", "").count("✨") for block in blocks) == 120
+
+    async def test_very_many_users_respect_slack_limits(self, birthday_channel):
+        """Çok kalabalık günlerde section metinleri 3000 karakteri, mesajlar 50 bloğu aşmaz; kimse atlanmaz."""
+        chat = FakeChat()
+        # Uzun isimlerle detay satırları 50 bloğa sığmaz, mesaj bölünmek zorunda kalır
+        users = [{"slack_id": f"U{i:010d}", "display_name": f"Kişi {i} " + "x" * 200, "birthday": None} for i in range(1000)]
+        service = BirthdayService(chat, FakeUserRepo(users), cron_client=None)
+
+        await service.check_and_celebrate()
+
+        blocks = [block for message in chat.messages for block in message["blocks"]]
+        texts = [block.get("text", {}).get("text", "") for block in blocks]
+        assert len(chat.messages) > 1
+        assert all(len(message["blocks"]) <= 50 for message in chat.messages)
+        assert all(len(text) <= 3000 for text in texts)
+        assert sum(text.count("✨") for text in texts) == 1000
+        mentions = "".join(text for text in texts if "✨" not in text)
+        assert all(f"<@{user['slack_id']}>" in mentions for user in users)
+        assert blocks[0]["type"] == "header"
+        assert blocks[-1]["type"] == "context"
+
+    async def test_no_birthdays(self, birthday_channel):
+        """Doğum günü yoksa mesaj gönderilmez."""
+        chat = FakeChat()
+        service = BirthdayService(chat, FakeUserRepo([]), cron_client=None)
+
+        await service.check_and_celebrate()
+
+        assert chat.messages == []
+
+
+class TestHelpers:
+    """Yaş ve isim yardımcıları testleri."""
+
+    def test_calculate_age(self):
+        """Doğum günü gelmediyse yaş bir eksik hesaplanır."""
+        service = BirthdayService(FakeChat(), FakeUserRepo([]), cron_client=None)
+        assert service._calculate_age("1990-06-15", (2026, 6, 15)) == 36
+        assert service._calculate_age("1990-06-16", (2026, 6, 15)) == 35
+        assert service._calculate_age("bozuk", (2026, 6, 15)) is None
+        assert service._calculate_age(None) is None
+
+
+
+class TestBirthdayQuery:
+    """UserRepository.get_users_with_birthday_today testleri."""
+
+    def test_display_name_and_slack_id_filter(self, db_client):
+        """İsim SQL'de birleştirilir, Slack ID'si olmayanlar elenir."""
+        from src.repositories.user_repository import UserRepository
+
+        today = date.today().strftime("%m-%d")
+        repo = UserRepository(db_client)
+        repo.create({"slack_id": "U1", "first_name": "Ali", "middle_name": "", "surname": "Veli", "full_name": "X", "birthday": f"1990-{today}"})
+        repo.create({"slack_id": "U2", "first_name": "Ayşe", "middle_name": "Nur", "surname": "Kaya", "full_name": "X", "birthday": f"1991-{today}"})
+        repo.create({"slack_id": "", "first_name": "Can", "surname": "Ak", "full_name": "Can Ak", "birthday": f"1992-{today}"})
+
+        users = {u["slack_id"]: u["display_name"] for u in repo.get_users_with_birthday_today()}
+        assert users == {"U1": "Ali Veli", "U2": "Ayşe Nur Kaya"}
+
+
+class CountingUserRepo(FakeUserRepo):
+    """Sorgu çağrılarını sayan sahte UserRepository."""
+
+    def __init__(self):
+        super().__init__([])
+        self.calls = 0
+
+    def get_users_with_birthday_today(self):
+        self.calls += 1
+        return super().get_users_with_birthday_today()
+
+
+class FakeCron:
+    """Eklenen işleri kaydeden sahte CronClient."""
+
+    def __init__(self):
+        self.jobs = []
+
+    def add_cron_job(self, func, cron_expression, job_id):
+        self.jobs.append(job_id)
+
+
+class TestMissingChannel:
+    """BIRTHDAY_CHANNEL_ID ayarlı değilken davranış testleri."""
+
+    async def test_check_skips_query(self, monkeypatch):
+        """Kanal yoksa veritabanı sorgusu yapılmaz."""
+        monkeypatch.delenv("BIRTHDAY_CHANNEL_ID", raising=False)
+        repo = CountingUserRepo()
+        service = BirthdayService(FakeChat(), repo, cron_client=None)
+
+        await service.check_and_celebrate()
+
+        assert repo.calls == 0
+
+    async def test_explicit_channel_overrides_env(self, monkeypatch):
+        """Parametreyle verilen kanal ortam değişkeni olmadan kullanılır."""
+        monkeypatch.delenv("BIRTHDAY_CHANNEL_ID", raising=False)
+        chat = FakeChat()
+        users = [{"slack_id": "U1", "display_name": "Ali Veli", "birthday": None}]
+        service = BirthdayService(chat, FakeUserRepo(users), cron_client=None, channel_id="CPARAM")
+
+        await service.check_and_celebrate()
+
+        assert chat.messages[0]["channel"] == "CPARAM"
+
+    def test_schedule_skipped(self, monkeypatch):
+        """Kanal yoksa günlük iş planlanmaz."""
+        monkeypatch.delenv("BIRTHDAY_CHANNEL_ID", raising=False)
+        cron = FakeCron()
+        BirthdayService(FakeChat(), FakeUserRepo([]), cron).schedule_daily_check()
+        assert cron.jobs == []
@@ -0,0 +1,76 @@
+"""
+ChatManager testleri.
+"""
+
+import asyncio
+import pytest
+from slack_sdk.errors import SlackApiError
+from src.commands.chat_commands import ChatManager
+from src.core.exceptions import SlackClientError
+
+
+class FakeChatClient:
+    """chat.postMessage çağrılarını kaydeden sahte Slack client."""
+
+    def __init__(self, ratelimited_once=False, retry_header="Retry-After"):
+        self.ratelimited_once = ratelimited_once
+        self.retry_header = retry_header
+        self.posts = []
+
+    def chat_postMessage(self, channel, text, blocks=None, **kwargs):
+        if self.ratelimited_once:
+            self.ratelimited_once = False
+            response = type("Response", (dict,), {"headers": {self.retry_header: "0"}})({"ok": False, "error": "ratelimited"})
+            raise SlackApiError("ratelimited", response)
+        self.posts.append(channel)
+        return {"ok": True, "ts": str(len(self.posts))}
+
+
+class TestEnqueuePost:
+    """Kanal bazlı hız sınırlı gönderim testleri."""
+
+    def test_burst_then_wait(self):
+        """Burst hakkı bitince aynı kanal için bekleme süresi döner, diğer kanallar etkilenmez."""
+        manager = ChatManager(FakeChatClient())
+        delays = [manager._reserve_post_slot("C1") for _ in range(ChatManager.POST_BURST + 1)]
+        assert delays[:-1] == [0.0] * ChatManager.POST_BURST
+        assert delays[-1] > 0
+        assert manager._reserve_post_slot("C2") == 0.0
+
+    async def test_retry_after_ratelimit(self):
+        """Rate limit hatasında tekrar denenir."""
+        client = FakeChatClient(ratelimited_once=True)
+        response = await ChatManager(client).enqueue_post(channel="C1", text="merhaba")
+        assert response["ok"] is True
+        assert client.posts == ["C1"]
+
+    async def test_lowercase_retry_after_header(self, monkeypatch):
+        """Retry-After header'ı küçük harfle gelse de okunur (varsayılan 1 saniye beklenmez)."""
+        sleeps = []
+        real_sleep = asyncio.sleep
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            await real_sleep(0)
+
+        monkeypatch.setattr("src.commands.chat_commands.asyncio.sleep", fake_sleep)
+        client = FakeChatClient(ratelimited_once=True, retry_header="retry-after")
+        response = await ChatManager(client).enqueue_post(channel="C1", text="merhaba")
+        assert response["ok"] is True
+        assert sleeps == [0]
+
+    async def test_other_errors_not_retried(self):
+        """Rate limit dışındaki hatalar tekrar denenmeden SlackClientError olarak iletilir."""
+        class FailingClient:
+            def __init__(self):
+                self.calls = 0
+
+            def chat_postMessage(self, channel, text, blocks=None, **kwargs):
+                self.calls += 1
+                raise SlackApiError("hata", {"ok": False, "error": "channel_not_found"})
+
+        client = FailingClient()
+        with pytest.raises(SlackClientError) as exc_info:
+            await ChatManager(client).enqueue_post(channel="C1", text="merhaba")
+        assert exc_info.value.extra["error"] == "channel_not_found"
+        assert client.calls == 1
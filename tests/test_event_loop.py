@@ -0,0 +1,54 @@
+"""
+Kalıcı event loop testleri.
+"""
+
+import asyncio
+import pytest
+from src.core.event_loop import get_event_loop, run_async
+
+
+class TestEventLoop:
+    """run_async testleri."""
+
+    def test_run_async_returns_result(self):
+        """Coroutine sonucu çağırana döner."""
+        async def add(a, b):
+            await asyncio.sleep(0)
+            return a + b
+
+        assert run_async(add(2, 3), timeout=5) == 5
+
+    def test_loop_is_reused(self):
+        """Her çağrıda aynı loop kullanılır."""
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = run_async(current_loop(), timeout=5)
+        second = run_async(current_loop(), timeout=5)
+        assert first is second is get_event_loop()
+
+    def test_to_thread_uses_loop_executor(self):
+        """asyncio.to_thread çağrıları loop'un kendi thread havuzunda çalışır."""
+        import threading
+
+        async def thread_name():
+            return await asyncio.to_thread(lambda: threading.current_thread().name)
+
+        assert run_async(thread_name(), timeout=5).startswith("cemil-io")
+
+    def test_timeout_raises_builtin_and_cancels(self):
+        """Zaman aşımında yerleşik TimeoutError fırlatılır ve coroutine loop'ta iptal edilir."""
+        import threading
+
+        cancelled = threading.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError):
+            run_async(slow(), timeout=0.05)
+        assert cancelled.wait(timeout=2)
@@ -0,0 +1,416 @@
+"""
+Yardımlaşma servisi testleri.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from src.core.exceptions import SlackClientError
+from src.services.help_service import HelpService
+
+
+class FakeUserManager:
+    """Kullanıcı listesini sayfa sayfa döndüren, sayfa isteklerini sayan sahte UserManager."""
+
+    def __init__(self, members, page_size=2):
+        self.pages = [members[i:i + page_size] for i in range(0, len(members), page_size)] or [[]]
+        self.calls = 0
+
+    def iter_all_users(self, page_size=200):
+        for page in self.pages:
+            self.calls += 1
+            yield from page
+
+
+def make_service(user_manager):
+    return HelpService(
+        chat_manager=None,
+        conv_manager=None,
+        user_manager=user_manager,
+        help_repo=None,
+        user_repo=None
+    )
+
+
+class TestWorkspaceOwner:
+    """_get_workspace_owner testleri."""
+
+    def test_owner_preferred_over_admin(self):
+        """Owner varsa admin'den önce seçilir."""
+        manager = FakeUserManager([{"id": "UADMIN", "is_admin": True}, {"id": "UOWNER", "is_owner": True}])
+        assert make_service(manager)._get_workspace_owner() == "UOWNER"
+
+    def test_admin_fallback(self):
+        """Owner yoksa admin döner."""
+        manager = FakeUserManager([{"id": "U1"}, {"id": "UADMIN", "is_admin": True}])
+        assert make_service(manager)._get_workspace_owner() == "UADMIN"
+
+    def test_stops_paging_after_owner(self):
+        """Owner ilk sayfada bulunursa sonraki sayfalar istenmez; admin sayfalar arası yedektir."""
+        members = [{"id": "U1"}, {"id": "UOWNER", "is_owner": True}, {"id": "U3"}, {"id": "U4"}]
+        manager = FakeUserManager(members)
+        assert make_service(manager)._get_workspace_owner() == "UOWNER"
+        assert manager.calls == 1
+
+        manager = FakeUserManager([{"id": "UADMIN", "is_admin": True}, {"id": "U2"}, {"id": "U3"}])
+        assert make_service(manager)._get_workspace_owner() == "UADMIN"
+        assert manager.calls == 2
+
+    def test_owner_is_cached(self):
+        """Owner önbellekten döner, refresh_owner ile yenilenir."""
+        manager = FakeUserManager([{"id": "UOWNER", "is_owner": True}])
+        service = make_service(manager)
+        assert service._get_workspace_owner() == "UOWNER"
+        assert service._get_workspace_owner() == "UOWNER"
+        assert manager.calls == 1
+
+        service.refresh_owner()
+        service._get_workspace_owner()
+        assert manager.calls == 2
+
+    def test_configured_owner_skips_listing(self):
+        """Ayarlarda owner verilmişse kullanıcı listesi istenmez."""
+        manager = FakeUserManager([{"id": "UOWNER", "is_owner": True}])
+        service = HelpService(None, None, manager, help_repo=None, user_repo=None, workspace_owner_id="UCONF")
+        assert service._get_workspace_owner() == "UCONF"
+        assert manager.calls == 0
+
+
+class FakeChat:
+    """Gönderilen mesajları kaydeden sahte ChatManager."""
+
+    def __init__(self):
+        self.messages = []
+
+    def post_message(self, channel, text, blocks=None, **kwargs):
+        self.messages.append({"channel": channel, "text": text, "blocks": blocks})
+        return {"ok": True, "ts": f"{len(self.messages)}.0"}
+
+    async def enqueue_post(self, channel, text, blocks=None, **kwargs):
+        return self.post_message(channel, text, blocks=blocks, **kwargs)
+
+
+class FakeConv:
+    """Kanal oluşturma ve davetleri kaydeden sahte ConversationManager."""
+
+    def __init__(self):
+        self.invites = []
+
+    def create_channel(self, name, is_private=False):
+        return {"id": "CHELP", "name": name}
+
+    def invite_users(self, channel_id, users):
+        self.invites.append((channel_id, list(users)))
+
+
+class FakeHelpRepo:
+    """Bellekte çalışan sahte HelpRepository."""
+
+    def __init__(self):
+        self.records = {}
+        self.updates = []
+
+    def create(self, data):
+        self.records["H" * 36] = dict(data)
+        return "H" * 36
+
+    def get(self, record_id):
+        return self.records.get(record_id)
+
+    def update(self, record_id, data):
+        self.updates.append(dict(data))
+        self.records[record_id].update(data)
+        return True
+
+
+class FakeUserRepo:
+    """Tek kullanıcılı sahte UserRepository."""
+
+    def get_by_slack_id(self, slack_id):
+        return {"slack_id": slack_id, "full_name": "Ali Veli"}
+
+    def get_display_name(self, slack_id):
+        return "Ali Veli"
+
+
+class CountingNameRepo:
+    """Toplu isim sorgularını kaydeden sahte UserRepository."""
+
+    def __init__(self, names):
+        self.names = names
+        self.batches = []
+
+    def get_names_by_slack_ids(self, slack_ids):
+        self.batches.append(list(slack_ids))
+        return {uid: self.names[uid] for uid in slack_ids if uid in self.names}
+
+
+class TestCreateHelpRequest:
+    """create_help_request testleri."""
+
+    async def test_creates_channel_invites_and_posts(self):
+        """Kanal oluşturulur, owner ve istek sahibi davet edilir, mesajlar gönderilir."""
+        chat, conv, repo = FakeChat(), FakeConv(), FakeHelpRepo()
+        service = HelpService(
+            chat_manager=chat,
+            conv_manager=conv,
+            user_manager=FakeUserManager([{"id": "UOWNER", "is_owner": True}]),
+            help_repo=repo,
+            user_repo=FakeUserRepo()
+        )
+
+        help_id = await service.create_help_request("U1", "CGENEL", "Python", "Flask nasıl kurulur?")
+        await asyncio.gather(*service._background_tasks)
+
+        assert conv.invites == [("CHELP", ["U1", "UOWNER"])]
+        assert sorted(m["channel"] for m in chat.messages) == ["CGENEL", "CHELP"]
+        message_ts = next(f"{i}.0" for i, m in enumerate(chat.messages, 1) if m["channel"] == "CGENEL")
+        assert repo.records[help_id]["help_channel_id"] == "CHELP"
+        assert repo.updates == [{"help_channel_id": "CHELP", "message_ts": message_ts}]
+
+    async def test_failed_channel_retrieves_owner_lookup_error(self, monkeypatch):
+        """Kanal oluşturulamazsa owner aramasının hatası sahipsiz kalmaz; istek mesajı yine gönderilir."""
+        import gc
+        import time
+
+        def failing_owner_lookup(self):
+            raise RuntimeError("owner araması hatası")
+
+        monkeypatch.setattr(HelpService, "_get_workspace_owner", failing_owner_lookup)
+
+        class FailingConv(FakeConv):
+            def create_channel(self, name, is_private=False):
+                time.sleep(0.05)
+                raise SlackClientError("kanal oluşturulamadı")
+
+        loop = asyncio.get_running_loop()
+        unhandled = []
+        loop.set_exception_handler(lambda _loop, context: unhandled.append(context))
+        chat = FakeChat()
+        service = HelpService(
+            chat_manager=chat,
+            conv_manager=FailingConv(),
+            user_manager=FakeUserManager([]),
+            help_repo=FakeHelpRepo(),
+            user_repo=FakeUserRepo()
+        )
+
+        try:
+            await service.create_help_request("U1", "CGENEL", "Python", "Flask nasıl kurulur?")
+            await asyncio.sleep(0.1)
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+
+        assert not unhandled
+        assert [m["channel"] for m in chat.messages] == ["CGENEL"]
+
+    async def test_welcome_posted_after_invite(self):
+        """Açılış mesajı, bot kanala davet edildikten sonra gönderilir."""
+        events = []
+
+        class OrderedConv(FakeConv):
+            def invite_users(self, channel_id, users):
+                events.append(("invite", channel_id))
+                super().invite_users(channel_id, users)
+
+        class OrderedChat(FakeChat):
+            def post_message(self, channel, text, blocks=None, **kwargs):
+                events.append(("post", channel))
+                return super().post_message(channel, text, blocks=blocks, **kwargs)
+
+        service = HelpService(
+            chat_manager=OrderedChat(),
+            conv_manager=OrderedConv(),
+            user_manager=FakeUserManager([{"id": "UOWNER", "is_owner": True}]),
+            help_repo=FakeHelpRepo(),
+            user_repo=FakeUserRepo()
+        )
+
+        await service.create_help_request("U1", "CGENEL", "Python", "Flask nasıl kurulur?")
+        await asyncio.gather(*service._background_tasks)
+
+        assert events.index(("invite", "CHELP")) < events.index(("post", "CHELP"))
+
+
+class TestLookupUserName:
+    """Toplu isim sorgusu testleri."""
+
+    async def test_concurrent_lookups_share_one_query(self):
+        """Aynı pencerede gelen sorgular tek repository çağrısıyla çözülür."""
+        repo = CountingNameRepo({"U1": "Ali Veli", "U2": "Ayşe Kaya"})
+        service = HelpService(None, None, None, help_repo=None, user_repo=repo)
+
+        names = await asyncio.gather(*(service._lookup_user_name(uid) for uid in ["U1", "U2", "U3"]))
+
+        assert names == ["Ali Veli", "Ayşe Kaya", "U3"]
+        assert repo.batches == [["U1", "U2", "U3"]]
+
+
+class AlreadyMemberConv:
+    """Daveti Slack hata koduyla reddeden sahte ConversationManager."""
+
+    def __init__(self, code):
+        self.code = code
+
+    def get_members(self, channel_id):
+        return []
+
+    def invite_users(self, channel_id, users):
+        raise SlackClientError("davet hatası", extra={"error": self.code})
+
+
+class TestJoinHelpChannel:
+    """join_help_channel testleri."""
+
+    def make(self, code):
+        repo = FakeHelpRepo()
+        repo.records["H"] = {"status": "open", "help_channel_id": "CHELP"}
+        repo.get = repo.records.get
+        return HelpService(FakeChat(), AlreadyMemberConv(code), None, help_repo=repo,
+                           user_repo=CountingNameRepo({"U2": "Ayşe Kaya"}))
+
+    async def test_already_in_channel_code_counts_as_joined(self):
+        """already_in_channel hata kodu başarılı katılım sayılır."""
+        result = await self.make("already_in_channel").join_help_channel("H", "U2")
+        assert result["success"] is True
+        assert result["already_joined"] is True
+
+    async def test_other_error_code_fails(self):
+        """Diğer hata kodlarında katılım başarısız döner."""
+        result = await self.make("channel_not_found").join_help_channel("H", "U2")
+        assert result["success"] is False
+
+    async def test_join_notice_failure_does_not_fail_join(self):
+        """Bilgilendirme mesajı arka planda gönderilir, hatası katılımı bozmaz."""
+        class JoiningConv(AlreadyMemberConv):
+            def invite_users(self, channel_id, users):
+                return {"id": channel_id}
+
+        class FailingChat(FakeChat):
+            def post_message(self, channel, text, blocks=None, **kwargs):
+                raise SlackClientError("gönderilemedi")
+
+        service = self.make(None)
+        service.conv, service.chat = JoiningConv(None), FailingChat()
+
+        result = await service.join_help_channel("H", "U2")
+        await asyncio.gather(*service._background_tasks, return_exceptions=True)
+
+        assert result["success"] is True
+        assert result["already_joined"] is False
+        assert not service._background_tasks
+
+
+    async def test_concurrent_joins_share_one_invite(self):
+        """Aynı kanala eşzamanlı katılımlar tek davet çağrısında birleştirilir."""
+        class RecordingConv(AlreadyMemberConv):
+            def __init__(self):
+                super().__init__(None)
+                self.invites = []
+
+            def invite_users(self, channel_id, users):
+                self.invites.append((channel_id, list(users)))
+                return {"id": channel_id}
+
+        service = self.make(None)
+        service.conv = RecordingConv()
+
+        results = await asyncio.gather(*(service.join_help_channel("H", uid) for uid in ["U2", "U3"]))
+        await asyncio.gather(*service._background_tasks, return_exceptions=True)
+
+        assert all(r["success"] for r in results)
+        assert service.conv.invites == [("CHELP", ["U2", "U3"])]
+
+
+class TestExpiredHelpChannels:
+    """Süresi dolan yardım kanalı süpürmesi testleri."""
+
+    def test_repository_returns_only_expired_unclosed(self, db_client):
+        """Sadece süresi dolmuş, kanalı olan ve kapatılmamış istekler döner."""
+        from src.repositories.help_repository import HelpRepository
+        from src.repositories.user_repository import UserRepository
+
+        db = db_client
+        UserRepository(db).create({"slack_id": "U1", "full_name": "Ali Veli"})
+        repo = HelpRepository(db)
+        # created_at SQLite'ta UTC olarak tutulur
+        old = (datetime.now(timezone.utc) - timedelta(minutes=30)).strftime("%Y-%m-%d %H:%M:%S")
+        repo.create({"id": "A", "requester_id": "U1", "topic": "t", "description": "d", "help_channel_id": "C1", "created_at": old})
+        repo.create({"id": "B", "requester_id": "U1", "topic": "t", "description": "d", "help_channel_id": "C2", "created_at": old, "status": "closed"})
+        repo.create({"id": "C", "requester_id": "U1", "topic": "t", "description": "d", "created_at": old})
+        repo.create({"id": "D", "requester_id": "U1", "topic": "t", "description": "d", "help_channel_id": "C4"})
+
+        assert repo.get_expired_help_channels(10) == [{"id": "A", "help_channel_id": "C1"}]
+
+    def test_repository_skips_requests_older_than_max_age(self, db_client):
+        """max_age_minutes'tan eski istekler süpürmeye dahil edilmez (geçmiş kayıtlar toplu işlenmez)."""
+        from src.repositories.help_repository import HelpRepository
+        from src.repositories.user_repository import UserRepository
+
+        UserRepository(db_client).create({"slack_id": "U1", "full_name": "Ali Veli"})
+        repo = HelpRepository(db_client)
+        recent = (datetime.now(timezone.utc) - timedelta(minutes=30)).strftime("%Y-%m-%d %H:%M:%S")
+        repo.create({"id": "A", "requester_id": "U1", "topic": "t", "description": "d", "help_channel_id": "C1", "created_at": recent})
+        repo.create({"id": "B", "requester_id": "U1", "topic": "t", "description": "d", "help_channel_id": "C2", "created_at": "2000-01-01 00:00:00"})
+
+        assert repo.get_expired_help_channels(10, max_age_minutes=60) == [{"id": "A", "help_channel_id": "C1"}]
+        assert repo.get_expired_help_channels(10, max_age_minutes=20) == []
+
+    async def test_sweep_closes_each_expired_channel(self, monkeypatch):
+        """Süpürme görevi her süresi dolan kanal için kapatmayı çağırır."""
+        class ExpiredRepo:
+            def __init__(self):
+                self.bulk_updates = []
+
+            def get_expired_help_channels(self, lifetime_minutes, max_age_minutes=24 * 60, limit=100):
+                return [{"id": "A", "help_channel_id": "C1"}, {"id": "B", "help_channel_id": "C2"}]
+
+            def bulk_update_status(self, help_ids, status):
+                self.bulk_updates.append((list(help_ids), status))
+
+        repo = ExpiredRepo()
+        service = HelpService(None, None, None, help_repo=repo, user_repo=None)
+        closed = []
+
+        async def fake_close(self, help_id, help_channel_id):
+            closed.append((help_id, help_channel_id))
+            return help_id == "A"
+
+        monkeypatch.setattr(HelpService, "_close_help_channel", fake_close)
+        await service._sweep_expired_help_channels()
+
+        assert sorted(closed) == [("A", "C1"), ("B", "C2")]
+        # Sadece kapatma adımları tamamlanan istek tek toplu güncellemeyle kapatılır
+        assert repo.bulk_updates == [(["A"], "closed")]
+
+    async def test_missing_channel_counts_as_closed(self):
+        """Kanal silinmiş veya arşivlenmişse istek kapatıldı sayılır; süpürme onu tekrar denemez."""
+        class GoneConv:
+            def __init__(self, code):
+                self.code = code
+
+            def get_history(self, channel_id, limit=100):
+                raise SlackClientError("geçmiş alınamadı", extra={"error": self.code})
+
+        repo = FakeHelpRepo()
+        help_id = repo.create({"requester_id": "U1", "topic": "t", "description": "d", "help_channel_id": "CHELP"})
+
+        for code in ("channel_not_found", "is_archived"):
+            service = HelpService(FakeChat(), GoneConv(code), None, help_repo=repo, user_repo=None)
+            assert await service._close_help_channel(help_id, "CHELP") is True
+
+        service = HelpService(FakeChat(), GoneConv("ratelimited"), None, help_repo=repo, user_repo=None)
+        assert await service._close_help_channel(help_id, "CHELP") is False
+
+    def test_bulk_update_status(self, db_client):
+        """Birden fazla isteğin durumu tek çağrıda güncellenir."""
+        from src.repositories.help_repository import HelpRepository
+        from src.repositories.user_repository import UserRepository
+
+        UserRepository(db_client).create({"slack_id": "U1", "full_name": "Ali Veli"})
+        repo = HelpRepository(db_client)
+        for help_id in ("A", "B", "C"):
+            repo.create({"id": help_id, "requester_id": "U1", "topic": "t", "description": "d"})
+
+        assert repo.bulk_update_status(["A", "B", "A"], "closed") == 2
+        assert [repo.get(h)["status"] for h in ("A", "B", "C")] == ["closed", "closed", "open"]
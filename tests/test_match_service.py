@@ -0,0 +1,54 @@
+"""
+Kahve eşleşmesi servisi testleri.
+"""
+
+import asyncio
+import gc
+import time
+import pytest
+from src.core.exceptions import CemilBotError, GroqClientError, SlackClientError
+from src.services.match_service import CoffeeMatchService
+
+
+class FailingGroq:
+    """Her istekte hata veren sahte GroqClient."""
+
+    async def quick_ask(self, system_prompt, user_prompt):
+        raise GroqClientError("LLM hatası")
+
+
+class FailingConv:
+    """Kanal oluşturmada (LLM hatasından sonra) hata veren sahte ConversationManager."""
+
+    def create_channel(self, name, is_private=False):
+        time.sleep(0.05)
+        raise SlackClientError("kanal oluşturulamadı")
+
+
+class FakeMatchRepo:
+    """Eşleşme kaydı oluşturan sahte MatchRepository."""
+
+    def create(self, data):
+        return "M1"
+
+
+class TestStartMatch:
+    """start_match testleri."""
+
+    async def test_setup_and_ice_breaker_failures_leave_no_unretrieved_error(self, monkeypatch):
+        """Kurulum ve tanışma mesajı birlikte başarısız olursa LLM hatası sahipsiz kalmaz."""
+        monkeypatch.delenv("ADMIN_CHANNEL_ID", raising=False)
+        loop = asyncio.get_running_loop()
+        unhandled = []
+        loop.set_exception_handler(lambda _loop, context: unhandled.append(context))
+        service = CoffeeMatchService(None, FailingConv(), FailingGroq(), None, FakeMatchRepo())
+
+        try:
+            with pytest.raises(CemilBotError):
+                await service.start_match("U1", "U2", user_name1="Ali", user_name2="Ayşe")
+            await asyncio.sleep(0.1)
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+
+        assert not unhandled
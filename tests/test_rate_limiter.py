@@ -57,3 +57,55 @@ class TestRateLimiter:
         # Reset
         limiter.reset("user1")
         assert limiter.is_allowed("user1")[0] is True
+
+
+class TestGetRateLimiter:
+    """get_rate_limiter singleton testleri."""
+
+    def test_returns_same_instance(self):
+        """Tekrar çağrıldığında aynı instance (ve aynı sayaçlar) döner."""
+        from src.core.rate_limiter import get_rate_limiter
+        assert get_rate_limiter() is get_rate_limiter(max_requests=1, window_seconds=1)
+
+
+class TestBlockedFastPath:
+    """Engellenen kullanıcılar için hızlı yol testleri."""
+
+    def test_blocked_user_skips_window_accounting(self):
+        """Engelliyken yeni istekler pencere listesine eklenmez."""
+        limiter = RateLimiter(max_requests=1, window_seconds=60)
+        assert limiter.is_allowed("user1")[0] is True
+        assert limiter.is_allowed("user1")[0] is False
+        assert "user1" in limiter.blocked_until
+
+        limiter.requests["user1"].clear()
+        allowed, msg = limiter.is_allowed("user1")
+        assert allowed is False
+        assert "saniye" in msg
+
+    def test_block_expires(self):
+        """Engel süresi dolunca istek tekrar değerlendirilir."""
+        limiter = RateLimiter(max_requests=1, window_seconds=1)
+        assert limiter.is_allowed("user1")[0] is True
+        assert limiter.is_allowed("user1")[0] is False
+        time.sleep(1.1)
+        assert limiter.is_allowed("user1")[0] is True
+        assert "user1" not in limiter.blocked_until
+
+    def test_expired_block_removed_concurrently(self):
+        """Süresi dolmuş engel başka bir thread tarafından silinmişse KeyError oluşmaz."""
+        from datetime import datetime, timedelta
+
+        class RacingDict(dict):
+            """Okumadan hemen sonra kaydı silerek başka bir thread'in silmesini taklit eder."""
+
+            def get(self, key, default=None):
+                value = super().get(key, default)
+                self.pop(key, None)
+                return value
+
+        limiter = RateLimiter(max_requests=1, window_seconds=60)
+        limiter.blocked_until = RacingDict({"user1": datetime.now() - timedelta(seconds=1)})
+
+        assert limiter.is_allowed("user1")[0] is True
+        limiter.cleanup_old_entries()
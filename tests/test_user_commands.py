@@ -0,0 +1,133 @@
+"""
+UserManager testleri.
+"""
+
+import pytest
+from slack_sdk.errors import SlackApiError
+from src.commands.user_commands import UserManager
+from src.core.exceptions import SlackClientError
+
+
+class FakeUsersClient:
+    """users.list çağrılarını sayfa sayfa döndüren sahte Slack client."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def users_list(self, limit=None, cursor=None):
+        self.calls.append({"limit": limit, "cursor": cursor})
+        index = int(cursor) if cursor else 0
+        next_cursor = str(index + 1) if index + 1 < len(self.pages) else ""
+        return {
+            "ok": True,
+            "members": self.pages[index],
+            "response_metadata": {"next_cursor": next_cursor}
+        }
+
+
+class TestUserPagination:
+    """users.list sayfalama testleri."""
+
+    def test_list_users_page(self):
+        """Tek sayfa sonucu sadeleştirilmiş döner."""
+        client = FakeUsersClient([[{"id": "U1"}], [{"id": "U2"}]])
+        page = UserManager(client).list_users_page(limit=50)
+        assert page["users"] == [{"id": "U1"}]
+        assert page["has_more"] is True
+        assert page["next_cursor"] == "1"
+        assert client.calls[0]["limit"] == 50
+
+    def test_iter_all_users(self):
+        """Tüm sayfalar sırayla gezilir."""
+        client = FakeUsersClient([[{"id": "U1"}, {"id": "U2"}], [{"id": "U3"}]])
+        users = list(UserManager(client).iter_all_users(page_size=2))
+        assert [u["id"] for u in users] == ["U1", "U2", "U3"]
+        assert [c["cursor"] for c in client.calls] == [None, "1"]
+
+    def test_iter_all_users_early_exit(self):
+        """Erken çıkışta sonraki sayfalar istenmez."""
+        client = FakeUsersClient([[{"id": "U1"}], [{"id": "U2"}]])
+        first = next(UserManager(client).iter_all_users())
+        assert first["id"] == "U1"
+        assert len(client.calls) == 1
+
+
+class FailingClient:
+    """Her çağrıda SlackApiError fırlatan sahte Slack client."""
+
+    def users_info(self, user=None):
+        raise SlackApiError("hata", {"ok": False, "error": "user_not_found"})
+
+
+class TestErrorHandling:
+    """Slack hata dönüşümü testleri."""
+
+    def test_slack_error_code_preserved(self):
+        """SlackApiError hata kodu SlackClientError mesajında korunur."""
+        with pytest.raises(SlackClientError, match="user_not_found"):
+            UserManager(FailingClient()).get_user_info("U1")
+
+    def test_network_error_wrapped(self):
+        """Bağlantı/zaman aşımı hataları da SlackClientError olarak iletilir."""
+        class TimeoutClient:
+            def users_info(self, user=None):
+                raise TimeoutError("zaman aşımı")
+
+        with pytest.raises(SlackClientError, match="zaman aşımı") as exc_info:
+            UserManager(TimeoutClient()).get_user_info("U1")
+        assert isinstance(exc_info.value.__cause__, TimeoutError)
+
+
+class FakeInfoClient:
+    """users.info çağrılarını kaydeden sahte Slack client."""
+
+    def __init__(self, missing=()):
+        self.missing = set(missing)
+        self.calls = []
+
+    def users_info(self, user=None):
+        self.calls.append(user)
+        if user in self.missing:
+            raise SlackApiError("hata", {"ok": False, "error": "user_not_found"})
+        return {"ok": True, "user": {"id": user}}
+
+
+class TestBatchGetUserInfo:
+    """batch_get_user_info testleri."""
+
+    async def test_batch_skips_missing_and_duplicates(self):
+        """Tekrarlanan ID'ler bir kez sorgulanır, bulunamayanlar sonuçta yer almaz."""
+        client = FakeInfoClient(missing={"U3"})
+        users = await UserManager(client).batch_get_user_info(["U1", "U2", "U1", "U3"], max_concurrency=2)
+        assert users == {"U1": {"id": "U1"}, "U2": {"id": "U2"}}
+        assert sorted(client.calls) == ["U1", "U2", "U3"]
+
+
+class RateLimitedInfoClient:
+    """İlk users.info çağrısında küçük harfli Retry-After header'ıyla rate limit hatası veren sahte client."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def users_info(self, user=None):
+        self.calls += 1
+        if self.calls == 1:
+            response = type("Response", (dict,), {"headers": {"retry-after": "7"}})({"ok": False, "error": "ratelimited"})
+            raise SlackApiError("ratelimited", response)
+        return {"ok": True, "user": {"id": user}}
+
+
+class TestRateLimitRetry:
+    """Rate limit tekrar denemesi testleri."""
+
+    def test_lowercase_retry_after_header(self, monkeypatch):
+        """Retry-After header'ı büyük/küçük harfe duyarsız okunur."""
+        sleeps = []
+        monkeypatch.setattr("src.commands.user_commands.time.sleep", sleeps.append)
+        client = RateLimitedInfoClient()
+
+        response = UserManager(client)._call_with_retry("users.info", client.users_info, user="U1")
+
+        assert response["user"] == {"id": "U1"}
+        assert sleeps == [7]
@@ -0,0 +1,91 @@
+"""
+UserRepository testleri (gerçek SQLite veritabanı ile).
+"""
+
+from types import SimpleNamespace
+from src.repositories.user_repository import UserRepository
+
+
+def rename_without_invalidation(db_client, slack_id, full_name):
+    """Önbelleği atlayarak veritabanındaki ismi doğrudan değiştirir."""
+    with db_client.get_connection() as conn:
+        conn.execute("UPDATE users SET full_name = ? WHERE slack_id = ?", (full_name, slack_id))
+        conn.commit()
+
+
+class TestNameCache:
+    """Slack ID önbelleği testleri."""
+
+    def test_cached_name_served_until_invalidated(self, db_client):
+        """İsim önbellekten döner; update önbelleği düşürür ve yeni isim okunur."""
+        repo = UserRepository(db_client)
+        user_id = repo.create({"slack_id": "U1", "full_name": "Ali Veli"})
+        assert repo.get_display_name("U1") == "Ali Veli"
+
+        rename_without_invalidation(db_client, "U1", "Ali Yıldız")
+        assert repo.get_display_name("U1") == "Ali Veli"
+
+        repo.update(user_id, {"full_name": "Ali Kaya"})
+        assert repo.get_display_name("U1") == "Ali Kaya"
+        assert repo.get_by_slack_id("U1")["full_name"] == "Ali Kaya"
+
+    def test_delete_invalidates_cache(self, db_client):
+        """Silinen kullanıcı önbellekten dönmez."""
+        repo = UserRepository(db_client)
+        user_id = repo.create({"slack_id": "U1", "full_name": "Ali Veli"})
+        assert repo.get_display_name("U1") == "Ali Veli"
+        assert repo.get_by_slack_id("U1") is not None
+
+        repo.delete(user_id)
+
+        assert repo.get_display_name("U1") is None
+        assert repo.get_by_slack_id("U1") is None
+        assert repo.get_names_by_slack_ids(["U1"]) == {}
+
+    def test_expired_entry_refetched(self, db_client, monkeypatch):
+        """TTL süresi dolan kayıt veritabanından yeniden okunur."""
+        import src.repositories.user_repository as module
+
+        now = [1000.0]
+        monkeypatch.setattr(module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+        repo = UserRepository(db_client)
+        repo.create({"slack_id": "U1", "full_name": "Ali Veli"})
+        assert repo.get_display_name("U1") == "Ali Veli"
+
+        rename_without_invalidation(db_client, "U1", "Ali Yıldız")
+        now[0] += UserRepository.CACHE_TTL_SECONDS - 1
+        assert repo.get_display_name("U1") == "Ali Veli"
+
+        now[0] += 2
+        assert repo.get_display_name("U1") == "Ali Yıldız"
+
+
+class TestBulkUpdateBySlackId:
+    """bulk_update_by_slack_id testleri."""
+
+    def test_column_groups_update_right_rows(self, db_client):
+        """Farklı kolon setli satırlar doğru kullanıcılara yazılır, diğer kolonlar ve kullanıcılar değişmez."""
+        repo = UserRepository(db_client)
+        for slack_id in ("U1", "U2", "U3", "U4"):
+            repo.create({"slack_id": slack_id, "full_name": f"Kişi {slack_id}", "cohort": "A"})
+        assert repo.get_display_name("U1") == "Kişi U1"
+
+        updated = repo.bulk_update_by_slack_id([
+            {"slack_id": "U1", "full_name": "Yeni U1"},
+            {"slack_id": "U2", "cohort": "B"},
+            {"slack_id": "U3", "cohort": "C", "full_name": "Yeni U3"},
+            {"slack_id": "U1", "cohort": "D"},
+            {"slack_id": "UYOK", "full_name": "Kimse"},
+            {"full_name": "Slack ID yok"},
+        ])
+
+        assert updated == 4
+        users = {slack_id: repo.get_by_slack_id(slack_id) for slack_id in ("U1", "U2", "U3", "U4")}
+        assert {k: (u["full_name"], u["cohort"]) for k, u in users.items()} == {
+            "U1": ("Yeni U1", "D"),
+            "U2": ("Kişi U2", "B"),
+            "U3": ("Yeni U3", "C"),
+            "U4": ("Kişi U4", "A"),
+        }
+        # Güncellenen kullanıcının önbellekteki eski ismi düşürülür
+        assert repo.get_display_name("U1") == "Yeni U1"